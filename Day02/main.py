@@ -1,5 +1,8 @@
 import os
-from typing import Optional, List, Tuple
+import sys
+import time
+import random
+from typing import Optional, List, Tuple, Iterator
 
 # --- Configuration ---
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -40,6 +43,121 @@ def get_ranges_from_file(file_path: str) -> Optional[List[Tuple[int, int]]]:
         print(f"Error reading file: {e}")
         return None
 
+# --- Candidate Enumeration ---
+
+def repunit_multiplier(total_len: int, block_len: int) -> int:
+    """
+    Returns the multiplier that repeats a block of 'block_len' digits until it
+    spans 'total_len' digits, e.g. (6, 2) -> 10101, so 12 * 10101 = 121212.
+    """
+    return (10 ** total_len - 1) // (10 ** block_len - 1)
+
+def prime_factors(n: int) -> List[int]:
+    """Returns the distinct prime factors of n in increasing order."""
+    factors = []
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            factors.append(p)
+            while n % p == 0:
+                n //= p
+        p += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+def block_lengths(total_len: int, any_repeat: bool) -> List[Tuple[int, int]]:
+    """
+    Returns the (block_len, sign) pairs needed to cover every number of
+    'total_len' digits that is built from a repeating block.
+
+    Part 1 only allows the block to appear twice. Part 2 allows any number of
+    repeats; a number with a period of b also has every multiple of b (that divides
+    total_len) as a period, so it is enough to look at the maximal periods
+    total_len / p for each prime p. Their overlaps are removed with
+    inclusion-exclusion over the products of those primes.
+    """
+    if not any_repeat:
+        return [(total_len // 2, 1)] if total_len % 2 == 0 else []
+
+    primes = prime_factors(total_len)
+    pairs = []
+    # Walk every non-empty subset of the prime factors (squarefree divisors > 1)
+    for mask in range(1, 1 << len(primes)):
+        divisor = 1
+        subset_size = 0
+        for i, p in enumerate(primes):
+            if mask >> i & 1:
+                divisor *= p
+                subset_size += 1
+        sign = 1 if subset_size % 2 == 1 else -1
+        pairs.append((total_len // divisor, sign))
+    return pairs
+
+def repeating_block_terms(
+    lower_bound: int, upper_bound: int, any_repeat: bool
+) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    Yields (sign, multiplier, first_block, last_block) for every (total length,
+    block length) pair that has candidates inside [lower_bound, upper_bound].
+    Every block in [first_block, last_block] times 'multiplier' is a candidate,
+    counted with 'sign'.
+    """
+    min_len = len(str(max(lower_bound, 1)))
+    max_len = len(str(upper_bound))
+
+    for total_len in range(min_len, max_len + 1):
+        for block_len, sign in block_lengths(total_len, any_repeat):
+            multiplier = repunit_multiplier(total_len, block_len)
+
+            # Blocks cannot start with a zero digit
+            first_block = max(10 ** (block_len - 1), -(-lower_bound // multiplier))
+            last_block = min(10 ** block_len - 1, upper_bound // multiplier)
+
+            if first_block <= last_block:
+                yield sign, multiplier, first_block, last_block
+
+def repeating_candidates(
+    lower_bound: int, upper_bound: int, any_repeat: bool
+) -> Iterator[Tuple[int, int]]:
+    """
+    Yields (sign, number) for every candidate inside [lower_bound, upper_bound].
+    Summing sign * number counts each matching number exactly once.
+    """
+    for sign, multiplier, first_block, last_block in repeating_block_terms(
+        lower_bound, upper_bound, any_repeat
+    ):
+        for block in range(first_block, last_block + 1):
+            yield sign, block * multiplier
+
+def block_series_sum(multiplier: int, first_block: int, last_block: int) -> int:
+    """
+    Sums block * multiplier for every block in [first_block, last_block].
+    The terms form an arithmetic progression, so this is O(1).
+    """
+    count = last_block - first_block + 1
+    return multiplier * (first_block + last_block) * count // 2
+
+def valid_numbers_sum(
+    ranges: List[Tuple[int, int]], any_repeat: bool, closed_form: bool = True
+) -> int:
+    """
+    Sums the repeating-block numbers found in all ranges. With 'closed_form' each
+    (total length, block length) pair is summed as an arithmetic series; otherwise
+    every candidate is enumerated and added one at a time.
+    """
+    total = 0
+    for lower_bound, upper_bound in ranges:
+        if closed_form:
+            for sign, multiplier, first_block, last_block in repeating_block_terms(
+                lower_bound, upper_bound, any_repeat
+            ):
+                total += sign * block_series_sum(multiplier, first_block, last_block)
+        else:
+            for sign, num in repeating_candidates(lower_bound, upper_bound, any_repeat):
+                total += sign * num
+    return total
+
 # --- Part 1 Logic ---
 
 def is_self_reflecting(number: int) -> bool:
@@ -63,13 +181,7 @@ def part1():
     if ranges is None:
         return
 
-    valid_numbers_sum = 0
-    for lower_bound, upper_bound in ranges:
-        for num in range(lower_bound, upper_bound + 1):
-            if is_self_reflecting(num):
-                valid_numbers_sum += num
-                
-    print(f"Part 1 answer: {valid_numbers_sum}")
+    print(f"Part 1 answer: {valid_numbers_sum(ranges, any_repeat=False)}")
 
 # --- Part 2 Logic ---
 
@@ -110,16 +222,78 @@ def part2():
     if ranges is None:
         return
 
-    valid_numbers_sum = 0
-    for lower_bound, upper_bound in ranges:
-        for num in range(lower_bound, upper_bound + 1):
-            if is_fully_repeating_block(num):
-                valid_numbers_sum += num
+    print(f"Part 2 answer: {valid_numbers_sum(ranges, any_repeat=True)}")
+
+# --- Benchmark ---
+
+def brute_force_sum(ranges: List[Tuple[int, int]], any_repeat: bool) -> int:
+    """Reference implementation: checks every integer in every range."""
+    check = is_fully_repeating_block if any_repeat else is_self_reflecting
+    return sum(
+        num
+        for lower_bound, upper_bound in ranges
+        for num in range(lower_bound, upper_bound + 1)
+        if check(num)
+    )
+
+def benchmark(trials: int = 200, max_width: int = 20000, seed: int = 2025):
+    """
+    Compares the candidate enumerator and the closed-form sums against the
+    brute-force checks on random ranges, verifying the sums match and reporting
+    the time taken by each. A second pass times the two fast paths on ranges far
+    too wide for brute force.
+    """
+    rng = random.Random(seed)
+    ranges = []
+    for _ in range(trials):
+        lower_bound = rng.randint(1, 10 ** rng.randint(1, 10))
+        ranges.append((lower_bound, lower_bound + rng.randint(0, max_width)))
+
+    for any_repeat in (False, True):
+        start = time.perf_counter()
+        expected = brute_force_sum(ranges, any_repeat)
+        brute_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        enumerated = valid_numbers_sum(ranges, any_repeat, closed_form=False)
+        enum_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        closed = valid_numbers_sum(ranges, any_repeat, closed_form=True)
+        closed_time = time.perf_counter() - start
+
+        label = "Part 2" if any_repeat else "Part 1"
+        status = "OK" if enumerated == expected == closed else (
+            f"MISMATCH (brute {expected}, enumerator {enumerated}, closed form {closed})"
+        )
+        print(
+            f"{label}: brute force {brute_time:.4f}s, enumerator {enum_time:.4f}s, "
+            f"closed form {closed_time:.6f}s [{status}]"
+        )
+
+    # Wide ranges: millions of matches per range
+    wide_ranges = [(10 ** 11, 10 ** 14 - 1), (123456789012, 987654321098765)]
+    for any_repeat in (False, True):
+        start = time.perf_counter()
+        enumerated = valid_numbers_sum(wide_ranges, any_repeat, closed_form=False)
+        enum_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        closed = valid_numbers_sum(wide_ranges, any_repeat, closed_form=True)
+        closed_time = time.perf_counter() - start
 
-    print(f"Part 2 answer: {valid_numbers_sum}")
+        label = "Part 2" if any_repeat else "Part 1"
+        status = "OK" if enumerated == closed else f"MISMATCH ({enumerated} != {closed})"
+        print(
+            f"{label} (wide): enumerator {enum_time:.4f}s, "
+            f"closed form {closed_time:.6f}s [{status}]"
+        )
 
 # --- Main Execution ---
 
 if __name__ == "__main__":
-    part1()
-    part2()
\ No newline at end of file
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        part1()
+        part2()
\ No newline at end of file
@@ -1,5 +1,16 @@
 import os
-from typing import Optional, List, Set, Tuple
+import sys
+import mmap
+import time
+import random
+from array import array
+from typing import Optional, List, Iterator, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional: without it the pure-Python functions are used
+    np = None
 
 # --- Configuration ---
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -8,6 +19,14 @@ FILE_PATH = os.path.join(SCRIPT_DIR, INPUT_FILE_NAME)
 
 TARGET_CHAR = '@'
 
+HAS_NUMPY = np is not None
+
+# Memory budget for the band-by-band Part 1 path over memory-mapped input
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+# Rough working memory per grid cell in a band: the padded cells, the translated
+# copy, the neighbor counts and the NumPy masks
+BAND_BYTES_PER_CELL = 8
+
 # --- Utility Functions ---
 
 def get_lines_from_file(file_path: str) -> Optional[List[str]]:
@@ -20,52 +39,346 @@ def get_lines_from_file(file_path: str) -> Optional[List[str]]:
         print(f"Error reading file: {e}")
         return None
 
-def count_neighbors(grid: List[str], r: int, c: int, target: str) -> int:
+# --- Grid Representation ---
+
+class PaddedGrid:
+    """
+    Compact occupancy grid: one byte per cell (1 for a target cell, 0 otherwise)
+    in a single bytearray, with a border of empty cells on every side. Cell (r, c)
+    lives at linear offset (r + 1) * width + (c + 1), and its 8 neighbors are at
+    fixed offsets from there, so neighbor visits need no bounds checks. Cells are
+    cleared in place when removed.
+    """
+
+    def __init__(self, lines: List[str], target: str):
+        self._build([line.encode() for line in lines], target)
+
+    @classmethod
+    def from_byte_rows(cls, rows: List[Union[bytes, memoryview]], target: str) -> "PaddedGrid":
+        """Builds the grid from raw byte rows, such as memoryviews over a mapped file."""
+        grid = cls.__new__(cls)
+        grid._build(rows, target)
+        return grid
+
+    def _build(self, rows: List[Union[bytes, memoryview]], target: str):
+        self.rows = len(rows)
+        self.cols = max((len(row) for row in rows), default=0)
+        self.width = self.cols + 2
+
+        # Map the target character to 1 and everything else to 0
+        table = bytearray(256)
+        table[ord(target)] = 1
+
+        raw = bytearray(self.width)  # top border
+        for row in rows:
+            raw.append(0)
+            raw += row
+            # Short rows are padded with empty cells
+            raw += bytes(self.cols - len(row) + 1)
+        raw += bytearray(self.width)  # bottom border
+        self.cells = raw.translate(table)
+
+        w = self.width
+        self.neighbor_offsets = (-w - 1, -w, -w + 1, -1, 1, w - 1, w, w + 1)
+
+    def interior_indices(self) -> range:
+        """Offsets spanning the grid rows (the left/right border cells are always 0)."""
+        return range(self.width, (self.rows + 1) * self.width)
+
+    def neighbor_counts(self) -> bytearray:
+        """
+        Returns the 3x3 neighborhood count (including the cell) for every target
+        cell, stored at the cell's offset. Non-target cells get 0.
+        """
+        cells = self.cells
+        w = self.width
+        counts = bytearray(len(cells))
+        for idx in self.interior_indices():
+            if cells[idx]:
+                counts[idx] = (
+                    cells[idx - w - 1] + cells[idx - w] + cells[idx - w + 1]
+                    + cells[idx - 1] + cells[idx] + cells[idx + 1]
+                    + cells[idx + w - 1] + cells[idx + w] + cells[idx + w + 1]
+                )
+        return counts
+
+# --- NumPy Backend ---
+
+def grid_view_numpy(grid: PaddedGrid) -> "np.ndarray":
+    """Zero-copy 2D uint8 view of the padded grid; writes go straight to grid.cells."""
+    return np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.rows + 2, grid.width)
+
+def box_sum_numpy(padded: "np.ndarray") -> "np.ndarray":
+    """
+    Sums every 3x3 neighborhood (including the center) of a padded 2D array by
+    adding the 9 shifted interior slices. The border of the result is left at 0.
+    """
+    height, width = padded.shape
+    sums = np.zeros(padded.shape, dtype=np.uint8)
+    if height < 3 or width < 3:
+        return sums
+
+    inner = sums[1:-1, 1:-1]
+    for dr in range(3):
+        for dc in range(3):
+            inner += padded[dr:dr + height - 2, dc:dc + width - 2]
+    return sums
+
+def count_accessible_numpy(
+    grid: PaddedGrid, threshold: int = 4, row_start: int = 0, row_stop: Optional[int] = None
+) -> int:
+    """Vectorized count_accessible."""
+    if row_stop is None:
+        row_stop = grid.rows
+    occupied = grid_view_numpy(grid)
+    counts = box_sum_numpy(occupied)
+    rows = slice(row_start + 1, row_stop + 1)
+    return int(np.count_nonzero((occupied[rows] == 1) & (counts[rows] <= threshold)))
+
+def peel_grid_numpy(grid: PaddedGrid, threshold: int = 4) -> int:
     """
-    Counts the number of TARGET_CHAR in the 3x3 neighborhood centered at (r, c),
-    including the cell (r, c) itself. Handles boundary conditions.
+    Vectorized peel_grid working in bulk rounds: every removable cell is cleared
+    at once, then the removals are subtracted from their neighbors' counts. Each
+    round only looks at the band of rows around the previous round's removals.
     """
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
-    neighbor_count = 0
+    occupied = grid_view_numpy(grid)
+    counts = box_sum_numpy(occupied)
+    height, width = occupied.shape
+
+    removed_count = 0
+    top, bottom = 1, height - 1
+
+    while top < bottom:
+        band = occupied[top:bottom]
+        removable = (band == 1) & (counts[top:bottom] <= threshold)
+        round_count = int(np.count_nonzero(removable))
+        if round_count == 0:
+            break
+
+        removed_count += round_count
+        band[removable] = 0
+
+        # Subtract each removed cell from its 3x3 neighborhood. Counts of cells
+        # that are already empty may wrap around, but they are never read again.
+        removed = removable[:, 1:-1].view(np.uint8)
+        for dr in range(-1, 2):
+            for dc in range(-1, 2):
+                counts[top + dr:bottom + dr, 1 + dc:width - 1 + dc] -= removed
 
-    # Iterate over the 3x3 neighborhood
-    for dr in range(-1, 2):
-        for dc in range(-1, 2):
-            nr, nc = r + dr, c + dc
+        changed_rows = np.flatnonzero(removable.any(axis=1)) + top
+        top = max(int(changed_rows[0]) - 1, 1)
+        bottom = min(int(changed_rows[-1]) + 2, height - 1)
 
-            # Check boundaries
-            if 0 <= nr < rows and 0 <= nc < cols:
-                if grid[nr][nc] == target:
-                    neighbor_count += 1
-                    
-    return neighbor_count
+    return removed_count
 
 # --- Part 1 Logic ---
 
+def count_accessible(
+    grid: PaddedGrid,
+    threshold: int = 4,
+    use_numpy: bool = HAS_NUMPY,
+    row_start: int = 0,
+    row_stop: Optional[int] = None,
+) -> int:
+    """
+    Counts target cells whose 3x3 neighborhood (including the cell itself) holds
+    'threshold' or fewer target cells. Only rows in [row_start, row_stop) are
+    counted; the other rows still contribute to their neighbors' counts.
+    """
+    if row_stop is None:
+        row_stop = grid.rows
+    if use_numpy:
+        return count_accessible_numpy(grid, threshold, row_start, row_stop)
+
+    cells = grid.cells
+    # Counts include the current cell; non-target cells have a count of 0
+    counts = grid.neighbor_counts()
+    return sum(
+        1
+        for idx in range((row_start + 1) * grid.width, (row_stop + 1) * grid.width)
+        if cells[idx] and counts[idx] <= threshold
+    )
+
+# --- Memory-Mapped Input ---
+
+class MappedGrid:
+    """
+    Read-only memory map of a grid file. Rows are handed out as zero-copy
+    memoryview slices of the map, so the file is never loaded as Python strings.
+    Pages behind rows that have been fully processed can be released to keep the
+    resident set small.
+    """
+
+    def __init__(self, file_path: str):
+        self._file = open(file_path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._map = None
+        self._view = memoryview(self._map) if self._map is not None else None
+        self._released_upto = 0
+
+    def __enter__(self) -> "MappedGrid":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+            try:
+                self._map.close()
+            except BufferError:
+                # Row views are still referenced (e.g. by a traceback); the map
+                # is unmapped once they are garbage collected
+                pass
+        self._file.close()
+
+    def iter_rows(self) -> Iterator[Tuple[int, memoryview]]:
+        """Yields (file offset, row) for every non-empty line, with whitespace stripped."""
+        if self._view is None:
+            return
+
+        data = self._map
+        size = len(data)
+        whitespace = b' \t\r\n'
+        pos = 0
+        while pos < size:
+            end = data.find(b'\n', pos)
+            if end == -1:
+                end = size
+            start, stop = pos, end
+            while start < stop and data[start] in whitespace:
+                start += 1
+            while stop > start and data[stop - 1] in whitespace:
+                stop -= 1
+            if start < stop:
+                yield start, self._view[start:stop]
+            pos = end + 1
+
+    def release_before(self, offset: int):
+        """Drops the resident pages that lie entirely before the given file offset."""
+        if self._view is None or not hasattr(mmap, 'MADV_DONTNEED'):
+            return
+        aligned = offset - offset % mmap.PAGESIZE
+        if aligned > self._released_upto:
+            self._map.madvise(mmap.MADV_DONTNEED, self._released_upto, aligned - self._released_upto)
+            self._released_upto = aligned
+
+    def iter_bands(self, memory_budget: int) -> Iterator[Tuple[List[memoryview], int, int]]:
+        """
+        Splits the grid into horizontal bands sized to fit the memory budget.
+        Yields (rows, row_start, row_stop): the band's rows plus one halo row above
+        and below where they exist, and the range of rows that belong to the band.
+        """
+        band_rows = 0
+        halo_above: Optional[memoryview] = None
+        pending: List[memoryview] = []
+        offsets: List[int] = []
+
+        for offset, row in self.iter_rows():
+            if not band_rows:
+                band_bytes = (len(row) + 2) * BAND_BYTES_PER_CELL
+                band_rows = max(1, memory_budget // band_bytes - 2)
+
+            pending.append(row)
+            offsets.append(offset)
+            if len(pending) <= band_rows:
+                continue
+
+            # The extra row is the halo below this band and the first row of the next
+            above = [halo_above] if halo_above is not None else []
+            yield above + pending, len(above), len(above) + band_rows
+
+            # Everything before the new halo row above can be dropped from memory
+            self.release_before(offsets[-2])
+            halo_above = pending[-2]
+            pending = pending[-1:]
+            offsets = offsets[-1:]
+
+        if pending:
+            above = [halo_above] if halo_above is not None else []
+            yield above + pending, len(above), len(above) + len(pending)
+
+def count_accessible_mapped(
+    file_path: str,
+    target: str = TARGET_CHAR,
+    threshold: int = 4,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    use_numpy: bool = HAS_NUMPY,
+) -> Optional[int]:
+    """
+    Part 1 over a memory-mapped grid file, processed in horizontal bands with one
+    halo row on each side so peak memory stays within 'memory_budget'. Gives the
+    same result as count_accessible on the fully loaded grid.
+    Returns None if the file cannot be read or holds no rows.
+    """
+    try:
+        with MappedGrid(file_path) as mapped:
+            total = None
+            for rows, row_start, row_stop in mapped.iter_bands(memory_budget):
+                band = PaddedGrid.from_byte_rows(rows, target)
+                del rows
+                band_count = count_accessible(band, threshold, use_numpy, row_start, row_stop)
+                total = (total or 0) + band_count
+            return total
+    except IOError as e:
+        print(f"Error reading file: {e}")
+        return None
+
 def part1():
     """
     Finds the number of '@' characters whose 3x3 neighborhood contains 4 or fewer '@' characters (including itself).
     """
-    grid = get_lines_from_file(FILE_PATH)
-    if grid is None or not grid:
+    valid_count = count_accessible_mapped(FILE_PATH)
+    if valid_count is None:
         return
 
-    valid_indices: List[Tuple[int, int]] = []
+    print(f"Part 1 answer: {valid_count}")
 
-    for r in range(len(grid)):
-        for c in range(len(grid[r])):
-            if grid[r][c] == TARGET_CHAR:
-                # Count neighbors including the current cell
-                count = count_neighbors(grid, r, c, TARGET_CHAR)
-                
-                # Check the condition: 4 or fewer '@' in the 3x3 neighborhood
-                if count <= 4:
-                    valid_indices.append((r, c))
+# --- Part 2 Logic ---
 
-    print(f"Part 1 answer: {len(valid_indices)}")
+def peel_grid(grid: PaddedGrid, threshold: int = 4, use_numpy: bool = HAS_NUMPY) -> int:
+    """
+    Repeatedly removes target cells whose 3x3 neighborhood (including the cell
+    itself) contains 'threshold' or fewer remaining target cells, until no more can
+    be removed. Removed cells are cleared in the grid; returns how many there were.
 
-# --- Part 2 Logic ---
+    Neighborhood counts are computed once. Removing a cell only lowers the counts of
+    its 8 neighbors, so those are the only cells re-checked; each cell is queued at
+    most once and the total work is O(rows * cols).
+    """
+    if use_numpy:
+        return peel_grid_numpy(grid, threshold)
+
+    cells = grid.cells
+    offsets = grid.neighbor_offsets
+    counts = grid.neighbor_counts()
+
+    # Cells are cleared as soon as they are queued, so each is queued once.
+    # Processing order does not matter, so a plain stack is enough.
+    frontier = array('q')
+    for idx in grid.interior_indices():
+        if cells[idx] and counts[idx] <= threshold:
+            cells[idx] = 0
+            frontier.append(idx)
+    removed_count = len(frontier)
+
+    while frontier:
+        idx = frontier.pop()
+        for offset in offsets:
+            neighbor = idx + offset
+            if cells[neighbor]:
+                counts[neighbor] -= 1
+                if counts[neighbor] <= threshold:
+                    cells[neighbor] = 0
+                    frontier.append(neighbor)
+                    removed_count += 1
+
+    return removed_count
 
 def part2():
     """
@@ -77,60 +390,57 @@ def part2():
     if grid is None or not grid:
         return
 
-    # Use a set to track indices that have been determined to be "valid"
-    valid_indices: Set[Tuple[int, int]] = set()
-    
-    # Store the maximum size reached for the final answer
-    max_valid_count = 0
-    
-    # Grid dimensions
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
-
-    # The simulation loop continues until the set of valid indices stabilizes (no new additions)
-    while True:
-        # A temporary set to store the candidates for the *next* state
-        newly_valid_candidates: Set[Tuple[int, int]] = set()
-        
-        # Track if any new indices were added in this iteration
-        new_indices_added = False
-
-        for r in range(rows):
-            for c in range(cols):
-                if grid[r][c] == TARGET_CHAR and (r, c) not in valid_indices:
-                    # Only consider '@' that are NOT already in the valid set
-
-                    # Count neighbors, but *only* if they are NOT in the 'valid_indices' set
-                    current_neighbor_count = 0
-                    for dr in range(-1, 2):
-                        for dc in range(-1, 2):
-                            nr, nc = r + dr, c + dc
-
-                            if 0 <= nr < rows and 0 <= nc < cols:
-                                if grid[nr][nc] == TARGET_CHAR:
-                                    # Count only the '@' that are not yet considered 'valid'
-                                    if (nr, nc) not in valid_indices:
-                                        current_neighbor_count += 1
-                    
-                    # Check the condition: 4 or fewer UN-VALIDATED '@' in the 3x3 neighborhood
-                    if current_neighbor_count <= 4:
-                        newly_valid_candidates.add((r, c))
-
-        # Check for convergence: if no new candidates were found
-        if not newly_valid_candidates:
-            break
-        
-        # Add all newly found candidates to the main set
-        valid_indices.update(newly_valid_candidates)
-        
-        # Update the max count (though it only increases, so the final count is the max)
-        max_valid_count = len(valid_indices)
+    # Counts only ever drop as cells become valid, so the final set does not
+    # depend on the order cells are processed in.
+    valid_count = peel_grid(PaddedGrid(grid, TARGET_CHAR))
+
+    print(f"Part 2 answer: {valid_count}")
+
+# --- Benchmark ---
+
+def benchmark(rows: int = 1000, cols: int = 1000, density: float = 0.7, seed: int = 2025):
+    """
+    Times Part 1 counting and Part 2 peeling with the pure-Python and NumPy
+    backends on a random grid, reporting cells/second and checking the answers match.
+    """
+    rng = random.Random(seed)
+    lines = [
+        ''.join(TARGET_CHAR if rng.random() < density else '.' for _ in range(cols))
+        for _ in range(rows)
+    ]
+    num_cells = rows * cols
+    print(f"{rows}x{cols} grid, density {density}")
+
+    backends = [False, True] if HAS_NUMPY else [False]
+    if not HAS_NUMPY:
+        print("NumPy is not installed; timing the pure-Python backend only.")
+
+    results = []
+    for use_numpy in backends:
+        label = "NumPy" if use_numpy else "Python"
+
+        start = time.perf_counter()
+        accessible = count_accessible(PaddedGrid(lines, TARGET_CHAR), use_numpy=use_numpy)
+        count_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        peeled = peel_grid(PaddedGrid(lines, TARGET_CHAR), use_numpy=use_numpy)
+        peel_time = time.perf_counter() - start
 
+        results.append((accessible, peeled))
+        print(
+            f"{label}: part 1 {num_cells / count_time:,.0f} cells/s, "
+            f"part 2 {num_cells / peel_time:,.0f} cells/s"
+        )
 
-    print(f"Part 2 answer: {len(valid_indices)}")
+    status = "OK" if all(r == results[0] for r in results) else f"MISMATCH {results}"
+    print(f"Part 1 {results[0][0]}, Part 2 {results[0][1]} [{status}]")
 
 # --- Main Execution ---
 
 if __name__ == "__main__":
-    part1()
-    part2()
\ No newline at end of file
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        part1()
+        part2()
\ No newline at end of file
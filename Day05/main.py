@@ -1,5 +1,17 @@
 import os
-from typing import Optional, List, Tuple
+import sys
+import time
+import random
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import Optional, List, Tuple, Iterable, Iterator
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional: without it the pure-Python functions are used
+    np = None
 
 # --- Configuration ---
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -8,84 +20,71 @@ FILE_PATH = os.path.join(SCRIPT_DIR, INPUT_FILE_NAME)
 
 Range = Tuple[int, int]
 
+HAS_NUMPY = np is not None
+# Number of check numbers converted to a NumPy array at a time when streaming
+STREAM_CHUNK_SIZE = 1 << 20
+
 # --- Utility Functions ---
 
-def parse_input_file(file_path: str) -> Optional[Tuple[List[Range], List[int]]]:
+def parse_range_section(lines: Iterator[str]) -> Tuple[List[Range], List[int]]:
     """
-    Reads and parses the input file, which is expected to contain a section of
-    'low-high' ranges followed by a section of single numbers. The sections are
-    separated by an empty line (which is removed by get_lines_from_file, so we look
-    for the change in line format).
+    Consumes 'low-high' lines from the iterator until the range section ends,
+    either at an empty line or at the first line that is not a range. Only the
+    range section is read; the iterator is left positioned at the check numbers.
 
-    Returns: ([valid_ranges], [check_numbers])
+    Returns: ([valid_ranges], [check numbers consumed while finding the end])
     """
-    try:
-        with open(file_path, 'r') as f:
-            lines = [line.strip() for line in f]
-    except IOError as e:
-        print(f"Error reading file: {e}")
-        return None
-
     valid_ranges: List[Range] = []
-    check_numbers: List[int] = []
-    
-    # State tracking
-    parsing_ranges = True
-    
+    carried_numbers: List[int] = []
+
     for line in lines:
         stripped_line = line.strip()
-        
+
         if not stripped_line:
             # Empty line separator
-            parsing_ranges = False
-            continue
+            break
 
-        if parsing_ranges:
-            # Parse as range 'low-high'
-            try:
-                low_str, high_str = stripped_line.split('-')
-                valid_ranges.append((int(low_str), int(high_str)))
-            except ValueError:
-                # If parsing a range fails, assume the range section is over
-                # and this line might be the start of the check numbers (or malformed).
-                # We'll re-process this line as a check number if it's not a range.
-                parsing_ranges = False
-                if stripped_line.isdigit():
-                    check_numbers.append(int(stripped_line))
-                else:
-                    print(f"Skipping malformed range/line: {stripped_line}")
-        else:
-            # Parse as single number
-            try:
-                check_numbers.append(int(stripped_line))
-            except ValueError:
-                print(f"Skipping non-numeric check value: {stripped_line}")
+        # Parse as range 'low-high'
+        try:
+            low_str, high_str = stripped_line.split('-')
+            valid_ranges.append((int(low_str), int(high_str)))
+        except ValueError:
+            # If parsing a range fails, assume the range section is over
+            # and this line might be the start of the check numbers (or malformed).
+            # We'll re-process this line as a check number if it's not a range.
+            if stripped_line.isdigit():
+                carried_numbers.append(int(stripped_line))
+            else:
+                print(f"Skipping malformed range/line: {stripped_line}")
+            break
 
-    return valid_ranges, check_numbers
+    return valid_ranges, carried_numbers
 
-# --- Part 1 Logic ---
+def iter_check_numbers(lines: Iterator[str]) -> Iterator[int]:
+    """Lazily parses the remaining lines of the iterator as single numbers."""
+    for line in lines:
+        stripped_line = line.strip()
+        if not stripped_line:
+            continue
 
-def part1():
-    """
-    Calculates the number of check numbers that fall within any of the defined ranges.
-    """
-    parsed_data = parse_input_file(FILE_PATH)
-    if parsed_data is None:
-        return
+        # Parse as single number
+        try:
+            yield int(stripped_line)
+        except ValueError:
+            print(f"Skipping non-numeric check value: {stripped_line}")
 
-    valid_ranges, check_numbers = parsed_data
-    
-    output_count = 0
-
-    for num in check_numbers:
-        for lower_bound, upper_bound in valid_ranges:
-            if lower_bound <= num <= upper_bound:
-                output_count += 1
-                break # Move to the next check number once a match is found
-                
-    print(f"Part 1 answer: {output_count}")
+def read_ranges_from_file(file_path: str) -> Optional[List[Range]]:
+    """Reads only the range section of the input file, ignoring the check numbers."""
+    try:
+        with open(file_path, 'r') as f:
+            valid_ranges, _ = parse_range_section(f)
+    except IOError as e:
+        print(f"Error reading file: {e}")
+        return None
 
-# --- Part 2 Logic ---
+    return valid_ranges
+
+# --- Interval Logic ---
 
 def merge_ranges(ranges: List[Range]) -> List[Range]:
     """
@@ -119,29 +118,325 @@ def merge_ranges(ranges: List[Range]) -> List[Range]:
     
     return merged_ranges
 
+def total_coverage(ranges: List[Range], use_numpy: bool = HAS_NUMPY) -> int:
+    """Counts the integers covered by at least one range."""
+    if use_numpy:
+        lower_bounds, upper_bounds = merge_ranges_numpy(ranges)
+        return int(np.sum(upper_bounds - lower_bounds + 1))
+
+    # Number of integers in a range [a, b] is b - a + 1
+    return sum(upper_bound - lower_bound + 1 for lower_bound, upper_bound in merge_ranges(ranges))
+
+# --- NumPy Backend ---
+
+def merge_ranges_numpy(ranges: List[Range]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Vectorized version of merge_ranges. Returns the merged lower and upper bounds
+    as two int64 arrays.
+
+    After sorting by lower bound, a running maximum of the upper bounds gives the
+    furthest point covered so far; a new merged range starts wherever the next
+    lower bound lies more than one past that point.
+    """
+    bounds = np.array(ranges, dtype=np.int64).reshape(-1, 2)
+    if len(bounds) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.copy()
+
+    order = np.argsort(bounds[:, 0], kind='stable')
+    lower_bounds = bounds[order, 0]
+    reach = np.maximum.accumulate(bounds[order, 1])
+
+    # gaps[i] is True when range i + 1 starts a new merged range
+    gaps = lower_bounds[1:] > reach[:-1] + 1
+    starts = np.concatenate(([0], np.flatnonzero(gaps) + 1))
+    ends = np.concatenate((starts[1:] - 1, [len(lower_bounds) - 1]))
+
+    return lower_bounds[starts], reach[ends]
+
+def count_contained_numpy(
+    lower_bounds: "np.ndarray", upper_bounds: "np.ndarray", numbers: "np.ndarray"
+) -> int:
+    """Counts the numbers that fall inside the merged ranges using searchsorted."""
+    if len(lower_bounds) == 0:
+        return 0
+
+    # Index of the last range starting at or before each number
+    idx = np.searchsorted(lower_bounds, numbers, side='right') - 1
+    inside = (idx >= 0) & (numbers <= upper_bounds[np.maximum(idx, 0)])
+    return int(np.count_nonzero(inside))
+
+# --- Interval Index ---
+
+class IntervalIndex:
+    """
+    Sorted, disjoint ranges stored as two parallel arrays of bounds, built from
+    the output of merge_ranges. Point queries use binary search over the lower
+    bounds instead of scanning every range. When NumPy is available, batch
+    queries are vectorized with searchsorted.
+    """
+
+    def __init__(self, ranges: List[Range], use_numpy: bool = HAS_NUMPY):
+        self.use_numpy = use_numpy
+        if use_numpy:
+            self._np_lower, self._np_upper = merge_ranges_numpy(ranges)
+            self.lower_bounds = array('q', self._np_lower.tobytes())
+            self.upper_bounds = array('q', self._np_upper.tobytes())
+        else:
+            merged = merge_ranges(ranges)
+            self.lower_bounds = array('q', (low for low, _ in merged))
+            self.upper_bounds = array('q', (high for _, high in merged))
+
+    def __len__(self) -> int:
+        return len(self.lower_bounds)
+
+    def __contains__(self, num: int) -> bool:
+        # Find the last range starting at or before num
+        idx = bisect_right(self.lower_bounds, num) - 1
+        return idx >= 0 and num <= self.upper_bounds[idx]
+
+    def count_contained(self, numbers: Iterable[int]) -> int:
+        """
+        Counts how many of the numbers fall inside any range. The numbers are
+        sorted and walked alongside the ranges in a single linear pass.
+        """
+        if self.use_numpy:
+            queries = np.fromiter(numbers, dtype=np.int64)
+            return count_contained_numpy(self._np_lower, self._np_upper, queries)
+
+        lower_bounds = self.lower_bounds
+        upper_bounds = self.upper_bounds
+        num_ranges = len(lower_bounds)
+
+        count = 0
+        idx = 0
+        for num in sorted(numbers):
+            # Skip ranges that end before this number
+            while idx < num_ranges and upper_bounds[idx] < num:
+                idx += 1
+            if idx == num_ranges:
+                break
+            if lower_bounds[idx] <= num:
+                count += 1
+
+        return count
+
+    def count_streaming(self, numbers: Iterable[int]) -> int:
+        """
+        Counts how many of the numbers fall inside any range without holding them
+        in memory. Each number is looked up with a binary search as it arrives,
+        or, with NumPy, in fixed-size chunks.
+        """
+        if not self.use_numpy:
+            return sum(1 for num in numbers if num in self)
+
+        numbers = iter(numbers)
+        count = 0
+        while True:
+            chunk = np.fromiter(islice(numbers, STREAM_CHUNK_SIZE), dtype=np.int64)
+            if len(chunk) == 0:
+                return count
+            count += count_contained_numpy(self._np_lower, self._np_upper, chunk)
+
+def count_hits_streaming(file_path: str) -> Optional[int]:
+    """
+    Builds the interval index from the range section, then streams the check
+    numbers through it. Peak memory depends on the number of ranges only.
+    """
+    try:
+        with open(file_path, 'r') as f:
+            valid_ranges, carried_numbers = parse_range_section(f)
+            index = IntervalIndex(valid_ranges)
+            return (
+                index.count_streaming(carried_numbers)
+                + index.count_streaming(iter_check_numbers(f))
+            )
+    except IOError as e:
+        print(f"Error reading file: {e}")
+        return None
+
+# --- Dynamic Interval Set ---
+
+class IntervalSet:
+    """
+    Mutable set of integers stored as sorted, disjoint ranges in two parallel
+    lists of bounds. Ranges can be inserted and removed without re-merging the
+    whole list, and 'total_coverage' is kept up to date with every change so the
+    Part 2 answer is always available.
+
+    Each update locates the affected ranges with binary search; ranges swallowed
+    by an update are removed once, so updates cost O(log n) amortized plus the
+    list splice.
+    """
+
+    def __init__(self, ranges: Iterable[Range] = ()):
+        merged = merge_ranges([(low, high) for low, high in ranges if low <= high])
+        self.lower_bounds: List[int] = [low for low, _ in merged]
+        self.upper_bounds: List[int] = [high for _, high in merged]
+        self.total_coverage = sum(high - low + 1 for low, high in merged)
+
+    def __len__(self) -> int:
+        return len(self.lower_bounds)
+
+    def __iter__(self) -> Iterator[Range]:
+        return zip(self.lower_bounds, self.upper_bounds)
+
+    def __contains__(self, num: int) -> bool:
+        # Find the last range starting at or before num
+        idx = bisect_right(self.lower_bounds, num) - 1
+        return idx >= 0 and num <= self.upper_bounds[idx]
+
+    def _covered(self, start: int, stop: int) -> int:
+        """Number of integers covered by the stored ranges with index in [start, stop)."""
+        return sum(
+            self.upper_bounds[k] - self.lower_bounds[k] + 1 for k in range(start, stop)
+        )
+
+    def insert(self, new_range: Range):
+        """Adds every integer in the range, merging with overlapping or contiguous ranges."""
+        low, high = new_range
+        if low > high:
+            return
+
+        # Ranges in [start, stop) overlap or touch [low, high]
+        start = bisect_left(self.upper_bounds, low - 1)
+        stop = bisect_right(self.lower_bounds, high + 1)
+
+        if start < stop:
+            low = min(low, self.lower_bounds[start])
+            high = max(high, self.upper_bounds[stop - 1])
+            self.total_coverage -= self._covered(start, stop)
+
+        self.lower_bounds[start:stop] = [low]
+        self.upper_bounds[start:stop] = [high]
+        self.total_coverage += high - low + 1
+
+    def remove(self, old_range: Range):
+        """Removes every integer in the range, trimming or splitting the ranges it overlaps."""
+        low, high = old_range
+        if low > high:
+            return
+
+        # Ranges in [start, stop) overlap [low, high]
+        start = bisect_left(self.upper_bounds, low)
+        stop = bisect_right(self.lower_bounds, high)
+        if start >= stop:
+            return
+
+        new_lower: List[int] = []
+        new_upper: List[int] = []
+
+        # Keep whatever sticks out on either side of the removed range
+        if self.lower_bounds[start] < low:
+            new_lower.append(self.lower_bounds[start])
+            new_upper.append(low - 1)
+        if self.upper_bounds[stop - 1] > high:
+            new_lower.append(high + 1)
+            new_upper.append(self.upper_bounds[stop - 1])
+
+        self.total_coverage -= self._covered(start, stop)
+        self.lower_bounds[start:stop] = new_lower
+        self.upper_bounds[start:stop] = new_upper
+        self.total_coverage += sum(h - l + 1 for l, h in zip(new_lower, new_upper))
+
+# --- Part 1 Logic ---
+
+def part1():
+    """
+    Calculates the number of check numbers that fall within any of the defined ranges.
+    """
+    output_count = count_hits_streaming(FILE_PATH)
+    if output_count is None:
+        return
+
+    print(f"Part 1 answer: {output_count}")
+
+# --- Part 2 Logic ---
 
 def part2():
     """
     Calculates the total number of integers covered by all ranges after merging 
     overlapping and contiguous ranges.
     """
-    parsed_data = parse_input_file(FILE_PATH)
-    if parsed_data is None:
+    valid_ranges = read_ranges_from_file(FILE_PATH)
+    if valid_ranges is None:
         return
 
-    valid_ranges, _ = parsed_data
-    
-    merged_ranges = merge_ranges(valid_ranges)
+    print(f"Part 2 answer: {total_coverage(valid_ranges)}")
+
+# --- Benchmark ---
+
+def benchmark(num_ranges: int = 10 ** 6, num_queries: int = 10 ** 7, seed: int = 2025):
+    """
+    Times merging, coverage and membership counting with the pure-Python and
+    NumPy backends on random data, checking that both give the same answers.
+    """
+    rng = random.Random(seed)
+    span = 10 ** 15
+    ranges = []
+    for _ in range(num_ranges):
+        lower_bound = rng.randrange(span)
+        ranges.append((lower_bound, lower_bound + rng.randrange(span // num_ranges)))
+    queries = [rng.randrange(span) for _ in range(num_queries)]
+    print(f"{num_ranges} ranges, {num_queries} queries")
+
+    backends = [False, True] if HAS_NUMPY else [False]
+    if not HAS_NUMPY:
+        print("NumPy is not installed; timing the pure-Python backend only.")
+
+    results = []
+    for use_numpy in backends:
+        label = "NumPy" if use_numpy else "Python"
+
+        start = time.perf_counter()
+        coverage = total_coverage(ranges, use_numpy=use_numpy)
+        coverage_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = IntervalIndex(ranges, use_numpy=use_numpy)
+        hits = index.count_contained(queries)
+        query_time = time.perf_counter() - start
+
+        results.append((coverage, hits))
+        print(f"{label}: coverage {coverage_time:.3f}s, membership {query_time:.3f}s")
+
+    status = "OK" if all(r == results[0] for r in results) else f"MISMATCH {results}"
+    print(f"Coverage {results[0][0]}, hits {results[0][1]} [{status}]")
+
+    check_interval_set(rng)
+
+def check_interval_set(rng: random.Random, num_ops: int = 5000, span: int = 2000):
+    """
+    Applies random inserts and removes to an IntervalSet and checks its ranges,
+    coverage and membership against merge_ranges over a plain set of covered numbers.
+    """
+    interval_set = IntervalSet()
+    covered = set()
+    mismatches = 0
+    for _ in range(num_ops):
+        low = rng.randrange(span)
+        high = low + rng.randrange(span // 20)
+        if rng.random() < 0.6:
+            interval_set.insert((low, high))
+            covered.update(range(low, high + 1))
+        else:
+            interval_set.remove((low, high))
+            covered.difference_update(range(low, high + 1))
+
+        expected = merge_ranges([(num, num) for num in covered])
+        if (list(interval_set) != expected
+                or interval_set.total_coverage != total_coverage(expected, use_numpy=False)
+                or any((num in interval_set) != (num in covered) for num in (low - 1, low, high, high + 1))):
+            mismatches += 1
 
-    total_coverage = 0
-    for lower_bound, upper_bound in merged_ranges:
-        # Number of integers in a range [a, b] is b - a + 1
-        total_coverage += upper_bound - lower_bound + 1
-        
-    print(f"Part 2 answer: {total_coverage}")
+    status = "OK" if not mismatches else f"MISMATCH in {mismatches} steps"
+    print(f"IntervalSet: {num_ops} random inserts/removes [{status}]")
 
 # --- Main Execution ---
 
 if __name__ == "__main__":
-    part1()
-    part2()
\ No newline at end of file
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        part1()
+        part2()
\ No newline at end of file
@@ -1,11 +1,27 @@
 import os
-from typing import Optional, List, Set, Tuple, Dict, Any
+import sys
+import time
+import random
+from typing import Optional, List, Set, Tuple, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional: without it the pure-Python functions are used
+    np = None
 
 # --- Configuration ---
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_FILE_NAME = 'input.txt'
 FILE_PATH = os.path.join(SCRIPT_DIR, INPUT_FILE_NAME)
 
+HAS_NUMPY = np is not None
+# A row can at most triple a column's count (its own paths plus a split from each
+# side), so int64 counts are safe while they stay below this limit
+INT64_SAFE_LIMIT = (2 ** 63 - 1) // 3
+
+SPLITTER_CODE = ord('^')
+
 # --- Utility Functions ---
 
 def get_lines_from_file(file_path: str) -> Optional[List[str]]:
@@ -20,55 +36,276 @@ def get_lines_from_file(file_path: str) -> Optional[List[str]]:
 
 # --- Core Logic ---
 
-# A global (or context-passing) set is needed to track the side effect for Part 1
+# The set of '^' cells reached by the beam, reported for Part 1
 SplitterIndices = Set[Tuple[int, int]]
+# One start column, or several beams entering at once
+StartColumns = Union[int, Sequence[int]]
 
-def beam_down(
-    r: int, 
-    c: int, 
-    grid: List[List[str]], 
-    memo: Dict[Tuple[int, int], int], 
-    splitter_indices: SplitterIndices
-) -> int:
-    """
-    Recursively calculates the number of "timelines" (paths) that can reach a cell.
-    '^' characters split the path (1 path in -> 2 paths out).
-    The function also tracks the indices of the '^' characters that were hit.
-    """
-    max_depth = len(grid)
-    
-    # Base Case 1: Reached the bottom of the grid successfully
-    if r >= max_depth:
-        return 1
-    
-    # Check boundaries horizontally (assuming the path stops if it goes out of bounds)
-    max_width = len(grid[0]) if grid and grid[0] else 0
-    if c < 0 or c >= max_width:
-        return 0
-        
-    # Memoization check
-    if (r, c) in memo:
-        return memo[(r, c)]
-    
-    result = 0
-    current_char = grid[r][c]
-    
-    if current_char == '^':
-        # Part 1 logic: track the splitter index
-        splitter_indices.add((r, c))
-        
-        # Split the beam: one path left, one path right (both at the current row)
-        result = (
-            beam_down(r, c - 1, grid, memo, splitter_indices) + 
-            beam_down(r, c + 1, grid, memo, splitter_indices)
-        )
-    else:
-        # Standard move: beam moves down to the next row
-        result = beam_down(r + 1, c, grid, memo, splitter_indices)
-    
-    # Store and return the result
-    memo[(r, c)] = result
-    return result
+def start_columns(start_c: StartColumns, width: int) -> List[int]:
+    """Normalizes the start column(s), dropping any that fall outside the grid."""
+    columns = [start_c] if isinstance(start_c, int) else list(start_c)
+    return [c for c in columns if 0 <= c < width]
+
+def propagate_beams(
+    grid: List[str], start_r: int, start_c: StartColumns, use_numpy: bool = HAS_NUMPY
+) -> Tuple[int, SplitterIndices]:
+    """
+    Pushes the beam down the grid one row at a time, keeping only the number of
+    "timelines" (paths) in each column of the current row.
+    A '^' character splits the path (1 path in -> 2 paths out): its count moves to
+    the columns on either side in the same row. Paths that leave the grid
+    horizontally stop, and paths that pass the last row are counted as timelines.
+    Several start columns can be given to send in one beam from each.
+
+    Returns (total timelines, set of '^' indices that were hit). Memory is O(width)
+    plus the splitter set, and there is no recursion.
+    """
+    if use_numpy:
+        return propagate_beams_numpy(grid, start_r, start_c)
+
+    width = len(grid[0]) if grid and grid[0] else 0
+    columns = start_columns(start_c, width)
+    if not columns:
+        return 0, set()
+
+    counts = [0] * width
+    for c in columns:
+        counts[c] += 1
+    splitter_indices: SplitterIndices = set()
+
+    for r in range(start_r, len(grid)):
+        row = grid[r][:width]
+        c = row.find('^')
+        while c != -1:
+            timelines = counts[c]
+            if timelines:
+                # Part 1 logic: track the splitter index
+                splitter_indices.add((r, c))
+
+                # Split the beam: one path left, one path right (both at the current row)
+                counts[c] = 0
+                if c > 0:
+                    counts[c - 1] += timelines
+                if c + 1 < width:
+                    counts[c + 1] += timelines
+            c = row.find('^', c + 1)
+
+    return sum(counts), splitter_indices
+
+def propagate_beams_numpy(
+    grid: List[str], start_r: int, start_c: StartColumns
+) -> Tuple[int, SplitterIndices]:
+    """
+    Vectorized propagate_beams: each row is a handful of array operations. The
+    counts at '^' columns are taken out and added back shifted one column left and
+    one column right.
+
+    Counts start as int64 and switch to Python ints (object dtype) before they
+    could overflow, so the result is exact for any grid. No column can exceed the
+    total, and a row of splits at most doubles it, so the running total decides.
+    """
+    width = len(grid[0]) if grid and grid[0] else 0
+    columns = start_columns(start_c, width)
+    if not columns:
+        return 0, set()
+
+    counts = np.zeros(width, dtype=np.int64)
+    np.add.at(counts, columns, 1)
+    splitter_indices: SplitterIndices = set()
+    total = len(columns)
+
+    # Paths spread at most one column per split, so only the columns in
+    # [low, high) can hold non-zero counts
+    low, high = min(columns), max(columns) + 1
+
+    for r in range(start_r, len(grid)):
+        row = grid[r]
+        if '^' not in row:
+            continue
+
+        # Widen the window by one column each side to catch the split paths
+        low, high = max(low - 1, 0), min(high + 1, width)
+        window = counts[low:high]
+
+        cells = np.frombuffer(row[low:high].encode(), dtype=np.uint8)
+        is_splitter = np.zeros(high - low, dtype=bool)
+        is_splitter[:len(cells)] = cells == SPLITTER_CODE
+
+        split = np.where(is_splitter, window, 0)
+        hit_columns = np.flatnonzero(split)
+        if len(hit_columns) == 0:
+            continue
+
+        # Part 1 logic: track the splitter indices
+        splitter_indices.update((r, low + int(c)) for c in hit_columns)
+
+        if counts.dtype != object and total > INT64_SAFE_LIMIT:
+            counts = counts.astype(object)
+            window = counts[low:high]
+            split = split.astype(object)
+
+        # Every split path becomes two, so the total grows by the split counts
+        total += sum(split.tolist())
+
+        # Split the beams: one path left, one path right (both at the current row)
+        window[is_splitter] = 0
+        window[:-1] += split[1:]
+        window[1:] += split[:-1]
+
+    # Summed as Python ints: the total can pass 2^63 while every column fits int64
+    return sum(counts.tolist()), splitter_indices
+
+def timeline_table(grid: List[str], start_r: int, use_numpy: bool = HAS_NUMPY) -> List[int]:
+    """
+    Computes, in a single bottom-up pass, the number of timelines for a beam
+    entering row 'start_r' at every column. Entry c of the result is what
+    propagate_beams(grid, start_r, c) would report for Part 2, so repeated
+    queries against the same grid become list lookups. Beams from several start
+    columns are independent, so their timelines are the sum of their entries.
+
+    Working up from the bottom, a plain cell passes on the count of the cell
+    below it, and a '^' cell takes the sum of the cells on either side.
+    """
+    if use_numpy:
+        return timeline_table_numpy(grid, start_r)
+
+    width = len(grid[0]) if grid and grid[0] else 0
+
+    # A path that passes the last row is one timeline
+    ways = [1] * width
+
+    for r in range(len(grid) - 1, start_r - 1, -1):
+        row = grid[r][:width]
+        c = row.find('^')
+        while c != -1:
+            left = ways[c - 1] if c > 0 else 0
+            right = ways[c + 1] if c + 1 < width else 0
+            ways[c] = left + right
+            c = row.find('^', c + 1)
+
+    return ways
+
+def timeline_table_numpy(grid: List[str], start_r: int) -> List[int]:
+    """Vectorized timeline_table, switching to Python ints before int64 could overflow."""
+    width = len(grid[0]) if grid and grid[0] else 0
+    ways = np.ones(width, dtype=np.int64)
+
+    for r in range(len(grid) - 1, start_r - 1, -1):
+        row = grid[r]
+        if '^' not in row:
+            continue
+
+        cells = np.frombuffer(row[:width].encode(), dtype=np.uint8)
+        is_splitter = np.zeros(width, dtype=bool)
+        is_splitter[:len(cells)] = cells == SPLITTER_CODE
+
+        if ways.dtype != object and ways.max() > INT64_SAFE_LIMIT:
+            ways = ways.astype(object)
+
+        # Sum of the neighboring columns, with 0 past either edge
+        neighbors = np.zeros_like(ways)
+        neighbors[1:] += ways[:-1]
+        neighbors[:-1] += ways[1:]
+        ways = np.where(is_splitter, neighbors, ways)
+
+    return [int(w) for w in ways]
+
+# --- Incremental Manifold ---
+
+class Manifold:
+    """
+    Editable grid that keeps the row-by-row beam counts of propagate_beams cached,
+    so adding or removing a single '^' does not require a full re-run.
+
+    entering[r] holds the timeline count per column for paths entering row r;
+    entering[-1] holds the paths that pass the last row. After an edit at (r, c)
+    only rows below r can change, and only inside a cone that starts at columns
+    c - 1 .. c + 1 and widens by one column per row. The update stops as soon as
+    a row comes out unchanged. Like the puzzle input, splitters are assumed never
+    to sit side by side.
+
+    The cache takes one count per cell, so memory is O(rows * width).
+    """
+
+    def __init__(self, grid: List[str], start_r: int, start_c: StartColumns):
+        self.width = len(grid[0]) if grid and grid[0] else 0
+        self.start_r = start_r
+        self.rows = [bytearray(line[:self.width].ljust(self.width, '.').encode()) for line in grid]
+
+        counts = [0] * self.width
+        for c in start_columns(start_c, self.width):
+            counts[c] += 1
+
+        self.entering: List[List[int]] = [counts]
+        self.splitters_hit = 0
+        for r in range(start_r, len(self.rows)):
+            self.splitters_hit += sum(
+                1 for c, timelines in enumerate(self.entering[-1])
+                if timelines and self.rows[r][c] == SPLITTER_CODE
+            )
+            self.entering.append(self._row_output(r, 0, self.width))
+
+        self.timelines = sum(self.entering[-1])
+
+    def _row_output(self, r: int, low: int, high: int) -> List[int]:
+        """Counts leaving row r in columns [low, high), from the counts entering it."""
+        row = self.rows[r]
+        counts = self.entering[r - self.start_r]
+        last = self.width - 1
+        output = []
+        for c in range(low, high):
+            timelines = 0 if row[c] == SPLITTER_CODE else counts[c]
+            if c > 0 and row[c - 1] == SPLITTER_CODE:
+                timelines += counts[c - 1]
+            if c < last and row[c + 1] == SPLITTER_CODE:
+                timelines += counts[c + 1]
+            output.append(timelines)
+        return output
+
+    def is_splitter(self, r: int, c: int) -> bool:
+        return self.rows[r][c] == SPLITTER_CODE
+
+    def set_splitter(self, r: int, c: int, present: bool):
+        """Adds or removes the '^' at (r, c) and refreshes both answers."""
+        if self.is_splitter(r, c) == present:
+            return
+
+        if r < self.start_r:
+            # Rows above the start are never visited by the beam
+            self.rows[r][c] = SPLITTER_CODE if present else ord('.')
+            return
+
+        # The splitter at (r, c) is hit if any paths enter its cell
+        if self.entering[r - self.start_r][c]:
+            self.splitters_hit += 1 if present else -1
+        self.rows[r][c] = SPLITTER_CODE if present else ord('.')
+
+        last_row = len(self.rows) - 1
+        low, high = max(c - 1, 0), min(c + 2, self.width)
+        for rr in range(r, last_row + 1):
+            new_counts = self._row_output(rr, low, high)
+            old_counts = self.entering[rr + 1 - self.start_r]
+            next_row = self.rows[rr + 1] if rr < last_row else None
+
+            changed = []
+            for c2, timelines in zip(range(low, high), new_counts):
+                old = old_counts[c2]
+                if timelines == old:
+                    continue
+                changed.append(c2)
+                old_counts[c2] = timelines
+                if next_row is None:
+                    self.timelines += timelines - old
+                elif next_row[c2] == SPLITTER_CODE and bool(timelines) != bool(old):
+                    self.splitters_hit += 1 if timelines else -1
+
+            if not changed:
+                break
+            low, high = max(changed[0] - 1, 0), min(changed[-1] + 2, self.width)
+
+    def toggle_splitter(self, r: int, c: int):
+        """Flips (r, c) between '^' and '.'."""
+        self.set_splitter(r, c, not self.is_splitter(r, c))
 
 def both():
     """
@@ -79,42 +316,158 @@ def both():
     if lines is None:
         return
 
-    # 1. Convert lines into a grid of characters
-    grid: List[List[str]] = [list(line) for line in lines]
-    
+    # 1. Each line is one row of the grid
+    grid: List[str] = lines
+
     if not grid or not grid[0]:
         print("Input grid is empty.")
         return
 
-    # 2. Find the starting position 'S'
-    start_j = -1
-    start_r = -1
-    
-    # Assuming 'S' is in the first row (r=0), as per typical grid start
-    try:
-        start_j = grid[0].index('S')
-        start_r = 0
-    except ValueError:
+    # 2. Find the starting position(s) 'S'
+    # Assuming 'S' is in the first row (r=0), as per typical grid start.
+    # Every 'S' in that row sends in its own beam.
+    start_js = [j for j, char in enumerate(grid[0]) if char == 'S']
+    if not start_js:
         print("Starting position 'S' not found in the first row.")
         return
 
-    # 3. Initialize state for the recursive call
-    # The original code started at r=1, so we must adjust the starting point
-    # to simulate the first move from 'S' at (0, start_j) to (1, start_j).
-    # Since the original code did NOT check lines[i][j] for 'S', the path
-    # effectively starts at (1, start_j).
-    start_r_sim = 1 
-    
-    memo: Dict[Tuple[int, int], int] = {}
-    splitter_indices: SplitterIndices = set()
+    # 3. Each beam makes its first move from 'S' at (0, start_j) to
+    # (1, start_j), so the simulation starts on the second row.
+    start_r_sim = 1
 
-    # The actual calculation starts by calling beam_down from the second row
-    new_timelines = beam_down(start_r_sim, start_j, grid, memo, splitter_indices)
+    new_timelines, splitter_indices = propagate_beams(grid, start_r_sim, start_js)
 
     print(f"Part 1 answer: {len(splitter_indices)}")
     print(f"Part 2 answer: {new_timelines}")
 
+# --- Benchmark ---
+
+def random_manifold(width: int, height: int, density: float, rng: random.Random) -> List[str]:
+    """
+    Builds a grid shaped like the puzzle input: 'S' in the middle of the top row
+    and splitters on every other row, never two side by side.
+    """
+    grid = ['.' * (width // 2) + 'S' + '.' * (width - width // 2 - 1)]
+    for r in range(1, height):
+        if r % 2:
+            grid.append('.' * width)
+            continue
+        row = ['.'] * width
+        for c in range(width):
+            if rng.random() < density and (c == 0 or row[c - 1] != '^'):
+                row[c] = '^'
+        grid.append(''.join(row))
+    return grid
+
+def doubling_manifold(width: int, splitter_rows: int) -> List[str]:
+    """
+    Builds a grid where every path hits a splitter on every splitter row, so the
+    timelines double per row and reach 2^splitter_rows.
+    """
+    middle = width // 2
+    grid = ['.' * middle + 'S' + '.' * (width - middle - 1)]
+    for k in range(splitter_rows):
+        grid.append('.' * width)
+        parity = (middle + k) % 2
+        grid.append(''.join('^' if c % 2 == parity else '.' for c in range(width)))
+    grid.append('.' * width)
+    return grid
+
+def benchmark(width: int = 10 ** 4, height: int = 2000, density: float = 0.1, seed: int = 2025):
+    """Times the pure-Python and NumPy propagators on a random grid and checks they agree."""
+    rng = random.Random(seed)
+    grid = random_manifold(width, height, density, rng)
+    start_j = grid[0].index('S')
+    print(f"{height}x{width} grid, splitter density {density}")
+
+    backends = [False, True] if HAS_NUMPY else [False]
+    if not HAS_NUMPY:
+        print("NumPy is not installed; timing the pure-Python backend only.")
+
+    results = []
+    for use_numpy in backends:
+        label = "NumPy" if use_numpy else "Python"
+        start = time.perf_counter()
+        timelines, splitter_indices = propagate_beams(grid, 1, start_j, use_numpy=use_numpy)
+        elapsed = time.perf_counter() - start
+        results.append((timelines, splitter_indices))
+        print(f"{label}: {elapsed * 1000:.1f} ms")
+
+    # Every start column at once, checked against the single-start run
+    start = time.perf_counter()
+    table = timeline_table(grid, 1)
+    elapsed = time.perf_counter() - start
+    results.append((table[start_j], results[0][1]))
+    print(f"Timeline table for all {width} start columns: {elapsed * 1000:.1f} ms")
+
+    status = "OK" if all(r == results[0] for r in results) else "MISMATCH"
+    timelines = results[0][0]
+    print(
+        f"Splitters hit {len(results[0][1])}, "
+        f"timelines ~10^{len(str(timelines)) - 1} [{status}]"
+    )
+
+    # The total passes 2^63 here while every column stays well inside int64
+    grid = doubling_manifold(401, 63)
+    start_j = grid[0].index('S')
+    results = [propagate_beams(grid, 1, start_j, use_numpy=use_numpy)[0] for use_numpy in backends]
+    status = "OK" if all(r == 2 ** 63 for r in results) else "MISMATCH"
+    print(f"Doubling {len(grid)}x401 grid: timelines {results[0]} [{status}]")
+
+def benchmark_edits(
+    width: int = 2000, height: int = 1000, density: float = 0.1, edits: int = 2000, seed: int = 2025
+):
+    """
+    Measures single-splitter edits per second on a cached Manifold against
+    re-running propagate_beams after every edit, and checks both end up equal.
+    """
+    rng = random.Random(seed)
+    grid = random_manifold(width, height, density, rng)
+    start_j = grid[0].index('S')
+    print(f"{height}x{width} grid, {edits} random splitter edits")
+
+    start = time.perf_counter()
+    manifold = Manifold(grid, 1, start_j)
+    build_time = time.perf_counter() - start
+
+    # Only edits that keep splitters apart, as in the puzzle input
+    positions = []
+    while len(positions) < edits:
+        r, c = rng.randrange(2, height, 2), rng.randrange(width)
+        row = manifold.rows[r]
+        if (c == 0 or row[c - 1] != SPLITTER_CODE) and (c == width - 1 or row[c + 1] != SPLITTER_CODE):
+            positions.append((r, c))
+            manifold.toggle_splitter(r, c)
+    # Undo the dry run so the timed run starts from the same grid
+    for r, c in reversed(positions):
+        manifold.toggle_splitter(r, c)
+
+    start = time.perf_counter()
+    for r, c in positions:
+        manifold.toggle_splitter(r, c)
+    edit_time = time.perf_counter() - start
+
+    full_runs = min(edits, 20)
+    start = time.perf_counter()
+    for _ in range(full_runs):
+        propagate_beams(grid, 1, start_j, use_numpy=False)
+    full_time = (time.perf_counter() - start) / full_runs
+
+    final_grid = [row.decode() for row in manifold.rows]
+    timelines, splitter_indices = propagate_beams(final_grid, 1, start_j, use_numpy=False)
+    status = "OK" if (timelines, len(splitter_indices)) == (
+        manifold.timelines, manifold.splitters_hit
+    ) else "MISMATCH"
+
+    print(f"Cache build: {build_time:.2f}s")
+    print(f"Incremental: {edits / edit_time:,.0f} edits/s")
+    print(f"Full re-run: {1 / full_time:,.1f} edits/s [{status}]")
+
 # --- Main Execution ---
 
 if __name__ == "__main__":
-    both()
\ No newline at end of file
+    if "--bench" in sys.argv:
+        benchmark()
+        benchmark_edits()
+    else:
+        both()
\ No newline at end of file
@@ -1,9 +1,34 @@
 import os
+import sys
+import time
+import heapq
+import random
+import itertools
+import math
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional: without it the pure-Python edge sources are used
+    np = None
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_FILE_NAME = 'input.txt'
 FILE_PATH = os.path.join(SCRIPT_DIR, INPUT_FILE_NAME)
 
+HAS_NUMPY = np is not None
+# Part 1 asks for the circuits after this many connections
+PART1_CONNECTIONS = 1000
+# Connection counts reported by --milestones
+MILESTONES = (10, 100, 1000, 100000)
+
+# Edges as compact records instead of Python tuples
+EDGE_DTYPE = np.dtype([('dist', np.int64), ('i', np.int32), ('j', np.int32)]) if HAS_NUMPY else None
+
 def get_lines_from_file():
     '''Reads lines from the specified file, stripping whitespace and empty lines.'''
     try:
@@ -14,78 +39,634 @@ def get_lines_from_file():
         print(f"Error reading file: {e}")
         return None
 
-def solve():
-    lines = get_lines_from_file()
-    if lines is None:
+class SpatialGrid:
+    '''
+    Uniform grid over the 3D points, used to find nearest neighbours without
+    comparing every pair. Cells are sized so each holds a few points on average.
+    '''
+
+    def __init__(self, coords, points_per_cell=2):
+        self.coords = coords
+        n = len(coords)
+        self.origin = [min(c[a] for c in coords) for a in range(3)]
+        extents = [max(c[a] for c in coords) - self.origin[a] + 1 for a in range(3)]
+
+        volume = extents[0] * extents[1] * extents[2]
+        self.cell_size = max(1, round((volume * points_per_cell / n) ** (1 / 3)))
+
+        self.cells = {}
+        for idx, point in enumerate(coords):
+            self.cells.setdefault(self.cell_of(point), []).append(idx)
+
+        # Beyond this radius (in cells) every cell has been visited
+        self.max_radius = max(-(-extent // self.cell_size) for extent in extents)
+
+    def cell_of(self, point):
+        size = self.cell_size
+        return tuple((point[a] - self.origin[a]) // size for a in range(3))
+
+    def shell(self, center, radius):
+        '''Yields the occupied cells whose Chebyshev distance from center is exactly radius.'''
+        cx, cy, cz = center
+        cells = self.cells
+        for dx in range(-radius, radius + 1):
+            for dy in range(-radius, radius + 1):
+                if abs(dx) == radius or abs(dy) == radius:
+                    dzs = range(-radius, radius + 1)
+                else:
+                    # Only the two faces of the cube along z
+                    dzs = (-radius, radius) if radius else (0,)
+                for dz in dzs:
+                    members = cells.get((cx + dx, cy + dy, cz + dz))
+                    if members:
+                        yield members
+
+    def nearest(self, i, k):
+        '''
+        Returns the k nearest other points to point i as (squared distance, j),
+        sorted by distance and then index. Returns every other point if there are
+        fewer than k.
+        '''
+        coords = self.coords
+        x, y, z = coords[i]
+        center = self.cell_of(coords[i])
+        candidates = []
+
+        for radius in itertools.count():
+            for members in self.shell(center, radius):
+                for j in members:
+                    if j != i:
+                        c = coords[j]
+                        candidates.append(((x - c[0]) ** 2 + (y - c[1]) ** 2 + (z - c[2]) ** 2, j))
+
+            if radius >= self.max_radius:
+                break
+            # Unvisited points are at least radius * cell_size away
+            if len(candidates) >= k:
+                kth = heapq.nsmallest(k, candidates)[-1][0]
+                if kth < (radius * self.cell_size) ** 2:
+                    break
+
+        return heapq.nsmallest(k, candidates)
+
+def spatial_edges(coords, initial_k=8):
+    '''
+    Yields (distance, index_a, index_b) for every pair, in the same order as sorting
+    all pairs, without building the full list up front.
+
+    Works in rounds on a k-nearest-neighbour graph: if every point's k-th neighbour
+    is at least T away, then every pair closer than T is in the graph. Each round
+    emits the pairs below that threshold and doubles k for the next one.
+    '''
+    n = len(coords)
+    if n < 2:
         return
 
-    coords = []
-    for line in lines:
-        coords.append(tuple(map(int, line.split(','))))
+    grid = SpatialGrid(coords)
+    lower = 0
+    k = initial_k
+
+    while True:
+        k = min(k, n - 1)
+        neighbors = [grid.nearest(i, k) for i in range(n)]
+
+        # With k = n - 1 the graph is complete, so everything left is emitted
+        upper = math.inf if k == n - 1 else min(lst[-1][0] for lst in neighbors)
+
+        batch = set()
+        for i, lst in enumerate(neighbors):
+            for dist, j in lst:
+                if lower <= dist < upper:
+                    batch.add((dist, i, j) if i < j else (dist, j, i))
+        yield from sorted(batch)
+
+        if upper == math.inf:
+            return
+        lower = upper
+        k *= 2
+
+def neighbor_stream(grid, i, initial_k=8):
+    '''
+    Yields (distance, j) for the points j > i in increasing (distance, j) order,
+    asking the spatial grid for more neighbours (doubling k) only when needed.
+    '''
+    n = len(grid.coords)
+    k = initial_k
+    last = None
+
+    while True:
+        k = min(k, n - 1)
+        nearest = grid.nearest(i, k)
+
+        # Points tied with the k-th neighbour may be missing from this batch,
+        # so only distances strictly below it are safe to emit
+        complete = k == n - 1
+        limit = math.inf if complete else nearest[-1][0]
+
+        for dist, j in nearest:
+            if dist >= limit:
+                break
+            if j > i and (last is None or (dist, j) > last):
+                last = (dist, j)
+                yield dist, j
+
+        if complete:
+            return
+        k *= 2
+
+def lazy_edges(coords, initial_k=8):
+    '''
+    Yields (distance, index_a, index_b) for every pair in sorted order by merging
+    one sorted neighbour stream per point through a heap. Each stream only grows
+    when its head is consumed, so the work depends on how many edges are taken.
+    '''
+    n = len(coords)
+    if n < 2:
+        return
+
+    grid = SpatialGrid(coords)
+    streams = [neighbor_stream(grid, i, initial_k) for i in range(n)]
+
+    heap = []
+    for i, stream in enumerate(streams):
+        head = next(stream, None)
+        if head is not None:
+            heap.append((head[0], i, head[1]))
+    heapq.heapify(heap)
+
+    while heap:
+        dist, i, j = heap[0]
+        yield dist, i, j
+
+        head = next(streams[i], None)
+        if head is None:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, (head[0], i, head[1]))
+
+def smallest_edges_numpy(edges, k):
+    '''
+    Returns the k smallest edges of a structured edge array by (dist, i, j),
+    unsorted. argpartition finds the k-th distance; edges tied with it are
+    ordered by index so the result matches a full sort exactly.
+    '''
+    if len(edges) <= k:
+        return edges
+
+    dists = edges['dist']
+    kth = dists[np.argpartition(dists, k - 1)[k - 1]]
+    below = edges[dists < kth]
+    tied = edges[dists == kth]
+    tied = tied[np.lexsort((tied['j'], tied['i']))][:k - len(below)]
+    return np.concatenate((below, tied))
+
+def blocked_smallest_edges(coords, k, block_size=1024):
+    '''
+    Computes squared distances tile by tile (block_size x block_size pairs at a
+    time, with int64 broadcasting) and keeps only the k smallest edges seen so far.
+    Memory stays bounded by one tile plus k edges. Returns a structured array
+    sorted by (dist, i, j).
+    '''
+    points = np.asarray(coords, dtype=np.int64).reshape(-1, 3)
+    n = len(points)
+    best = np.empty(0, dtype=EDGE_DTYPE)
+
+    for row_start in range(0, n, block_size):
+        rows = points[row_start:row_start + block_size]
+        row_ids = np.arange(row_start, row_start + len(rows), dtype=np.int32)
+
+        for col_start in range(row_start, n, block_size):
+            cols = points[col_start:col_start + block_size]
+            col_ids = np.arange(col_start, col_start + len(cols), dtype=np.int32)
+
+            diff = rows[:, None, :] - cols[None, :, :]
+            dists = np.einsum('ijk,ijk->ij', diff, diff)
+
+            # Only pairs with i < j
+            ii, jj = np.nonzero(row_ids[:, None] < col_ids[None, :])
+            tile = np.empty(len(ii), dtype=EDGE_DTYPE)
+            tile['dist'] = dists[ii, jj]
+            tile['i'] = row_ids[ii]
+            tile['j'] = col_ids[jj]
+
+            best = smallest_edges_numpy(
+                np.concatenate((best, smallest_edges_numpy(tile, k))), k
+            )
+
+    return np.sort(best, order=('dist', 'i', 'j'))
+
+def numpy_edges(coords, initial_k=4096, block_size=1024):
+    '''
+    Yields (distance, index_a, index_b) in sorted order from the blocked NumPy
+    path. The k smallest edges are computed first; if the consumer needs more,
+    k is doubled and the next slice of the ordering is produced.
+    '''
+    n = len(coords)
+    total = n * (n - 1) // 2
+    emitted = 0
+    k = initial_k
+
+    while emitted < total:
+        k = min(k, total)
+        edges = blocked_smallest_edges(coords, k, block_size)
+        yield from edges[emitted:].tolist()
+        emitted = len(edges)
+        k *= 2
+
+# Points shared with each worker process once, by the pool initializer
+_worker_coords = None
+
+def _init_worker(coords):
+    global _worker_coords
+    _worker_coords = coords
+
+def _sorted_run_worker(row_start, row_stop, k, after, shm_name):
+    '''
+    Computes every pair (i, j) with row_start <= i < row_stop and i < j that sorts
+    after the edge 'after' (None for the first slice), keeps the k smallest in
+    sorted order and writes them into the shared memory block as (dist, i, j)
+    int64 triples. Returns the number of edges written; fewer than k means the
+    chunk has no pairs left.
+    '''
+    coords = _worker_coords
+    n = len(coords)
+    after_dist, after_i, after_j = after if after is not None else (-1, -1, -1)
+
+    def pairs():
+        for i in range(row_start, row_stop):
+            x, y, z = coords[i]
+            for j in range(i + 1, n):
+                c = coords[j]
+                dist = (x - c[0]) ** 2 + (y - c[1]) ** 2 + (z - c[2]) ** 2
+                if dist > after_dist or (dist == after_dist and (i, j) > (after_i, after_j)):
+                    yield (dist, i, j)
+
+    run = heapq.nsmallest(k, pairs())
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        flat = array('q', [value for edge in run for value in edge])
+        shm.buf[:len(flat) * flat.itemsize] = flat.tobytes()
+    finally:
+        shm.close()
+    return len(run)
+
+def split_rows(n, num_chunks):
+    '''Splits rows 0..n-1 into contiguous chunks holding roughly equal numbers of pairs.'''
+    total = n * (n - 1) // 2
+    target = max(1, -(-total // num_chunks))
+    chunks = []
+    row_start = 0
+    pairs = 0
+    for i in range(n):
+        # Row i pairs with every j > i
+        pairs += n - 1 - i
+        if pairs >= target or i == n - 1:
+            chunks.append((row_start, i + 1))
+            row_start = i + 1
+            pairs = 0
+    return chunks
+
+def _read_run(shm, count):
+    '''Returns the (dist, i, j) triples a worker wrote into shared memory.'''
+    flat = array('q')
+    flat.frombytes(bytes(shm.buf[:count * 3 * flat.itemsize]))
+    return list(zip(flat[0::3], flat[1::3], flat[2::3]))
+
+def parallel_edges(coords, k=4096, workers=None, chunks_per_worker=4):
+    '''
+    Yields (distance, index_a, index_b) in sorted order, computing the pairs in
+    worker processes. The rows are split into chunks with similar pair counts;
+    each worker returns a sorted run of its chunk's k smallest pairs that come
+    after the chunk's last run, in a shared memory block of k triples.
+
+    Every edge up to the smallest of the runs' last edges is final, so the runs
+    are k-way merged up to that point. The chunks whose runs were used up then go
+    back to the pool for their next slice; the others keep their leftovers.
+    Shared memory stays at one block of k edges per chunk.
+    '''
+    n = len(coords)
+    if n < 2:
+        return
 
+    workers = workers or os.cpu_count() or 1
+    chunks = split_rows(n, workers * chunks_per_worker)
+    itemsize = array('q').itemsize
+    runs = [[] for _ in chunks]
+    last = [None] * len(chunks)
+    exhausted = [False] * len(chunks)
+
+    blocks = [shared_memory.SharedMemory(create=True, size=k * 3 * itemsize) for _ in chunks]
+    try:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(coords,)) as pool:
+            while True:
+                refill = [c for c in range(len(chunks)) if not runs[c] and not exhausted[c]]
+                futures = [
+                    pool.submit(_sorted_run_worker, *chunks[c], k, last[c], blocks[c].name)
+                    for c in refill
+                ]
+                for c, future in zip(refill, futures):
+                    runs[c] = _read_run(blocks[c], future.result())
+                    if runs[c]:
+                        last[c] = runs[c][-1]
+                    exhausted[c] = len(runs[c]) < k
+
+                if not any(runs):
+                    return
+
+                # Chunks with pairs left may still produce anything above their last edge
+                limits = [last[c] for c in range(len(chunks)) if not exhausted[c]]
+                limit = min(limits) if limits else None
+
+                ready = []
+                for c, run in enumerate(runs):
+                    cut = len(run) if limit is None else bisect_right(run, limit)
+                    ready.append(run[:cut])
+                    runs[c] = run[cut:]
+                yield from heapq.merge(*ready)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+class ComponentSizes:
+    '''
+    Multiset of component sizes: a count per size plus a sorted list of the
+    distinct sizes. A set of n elements can only have about sqrt(2n) distinct
+    component sizes, so the list stays tiny and the largest components are found
+    without visiting every root.
+    '''
+
+    def __init__(self, n):
+        # component size -> number of components with that size
+        self.size_counts = {1: n} if n else {}
+        self.distinct_sizes = [1] if n else []
+
+    def remove(self, size):
+        self.size_counts[size] -= 1
+        if not self.size_counts[size]:
+            del self.size_counts[size]
+            del self.distinct_sizes[bisect_left(self.distinct_sizes, size)]
+
+    def add(self, size):
+        if size in self.size_counts:
+            self.size_counts[size] += 1
+        else:
+            self.size_counts[size] = 1
+            insort(self.distinct_sizes, size)
+
+    def merge(self, size_a, size_b):
+        '''Replaces two components by their union.'''
+        self.remove(size_a)
+        self.remove(size_b)
+        self.add(size_a + size_b)
+
+    def top(self, k):
+        '''Returns the k largest sizes, largest first.'''
+        sizes = []
+        for size in reversed(self.distinct_sizes):
+            sizes.extend([size] * min(self.size_counts[size], k - len(sizes)))
+            if len(sizes) == k:
+                break
+        return sizes
+
+class DisjointSet:
+    '''
+    Union-Find over n elements, stored in two array('i') buffers, with iterative
+    path halving and union by size. Component sizes are also tracked in a
+    ComponentSizes multiset for top-k queries.
+    '''
+
+    def __init__(self, n):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self.num_components = n
+        self.sizes = ComponentSizes(n)
+
+    def find(self, i):
+        parent = self.parent
+        while parent[i] != i:
+            # Path halving: point every other node at its grandparent
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, i, j):
+        '''Merges the components of i and j. Returns False if they were already connected.'''
+        root_i = self.find(i)
+        root_j = self.find(j)
+        if root_i == root_j:
+            return False
+
+        size = self.size
+        # Union by size
+        if size[root_i] < size[root_j]:
+            root_i, root_j = root_j, root_i
+
+        self.sizes.merge(size[root_i], size[root_j])
+        self.parent[root_j] = root_i
+        size[root_i] += size[root_j]
+
+        self.num_components -= 1
+        return True
+
+    def component_size(self, i):
+        return self.size[self.find(i)]
+
+    def top_sizes(self, k):
+        '''Returns the sizes of the k largest components, largest first.'''
+        return self.sizes.top(k)
+
+class MergeLog:
+    '''
+    Compact record of one Kruskal pass: for every merge, the index of the edge
+    that caused it and the sizes of the two components it joined. The component
+    sizes after any number of connections can be rebuilt from it without
+    touching the edges or the union-find again.
+    '''
+
+    def __init__(self, n):
+        self.n = n
+        self.edge_index = array('q')
+        self.size_a = array('i')
+        self.size_b = array('i')
+        self.edges_used = 0
+        self.final_edge = None
+
+    def record(self, idx, size_a, size_b):
+        self.edge_index.append(idx)
+        self.size_a.append(size_a)
+        self.size_b.append(size_b)
+
+    def top_sizes_after(self, milestones, k=3):
+        '''
+        Returns {milestone: sizes of the k largest components after that many
+        connections}. The milestones are answered in one replay of the log.
+        '''
+        sizes = ComponentSizes(self.n)
+        num_merges = len(self.edge_index)
+        pos = 0
+        results = {}
+
+        for milestone in sorted(set(milestones)):
+            while pos < num_merges and self.edge_index[pos] < milestone:
+                sizes.merge(self.size_a[pos], self.size_b[pos])
+                pos += 1
+            results[milestone] = sizes.top(k)
+
+        return results
+
+def build_merge_log(coords, edges):
+    '''Runs Kruskal's loop over the edges (shortest first) until everything is connected.'''
+    circuits = DisjointSet(len(coords))
+    log = MergeLog(len(coords))
+
+    for idx, (dist, i, j) in enumerate(edges):
+        log.edges_used = idx + 1
+
+        # Note: redundant connections (already in same circuit)
+        # still count as connections for the milestones.
+        size_i = circuits.component_size(i)
+        size_j = circuits.component_size(j)
+        if circuits.union(i, j):
+            log.record(idx, size_i, size_j)
+
+            if circuits.num_components == 1:
+                log.final_edge = (i, j)
+                break
+
+    return log
+
+def connect_circuits(coords, edges):
+    '''
+    Runs Kruskal's loop over the edges (shortest first) and returns
+    (part1_ans, part2_ans, edges_used).
+    '''
+    log = build_merge_log(coords, edges)
+
+    # PART 1: Milestone at the 1000th connection
+    part1_ans = None
+    if log.edges_used >= PART1_CONNECTIONS:
+        # Product of the 3 largest circuit sizes
+        part1_ans = math.prod(log.top_sizes_after([PART1_CONNECTIONS])[PART1_CONNECTIONS])
+
+    # PART 2: Milestone when the very last merge happens
+    part2_ans = None
+    if log.final_edge is not None:
+        i, j = log.final_edge
+        part2_ans = coords[i][0] * coords[j][0]
+
+    return part1_ans, part2_ans, log.edges_used
+
+def milestone_report(coords, milestones=MILESTONES):
+    '''
+    Prints the product of the 3 largest circuit sizes after each milestone
+    number of connections, plus the final merge, from a single Kruskal pass.
+    '''
+    log = build_merge_log(coords, lazy_edges(coords))
+    for milestone, sizes in log.top_sizes_after(milestones).items():
+        print(f"After {milestone} connections: {math.prod(sizes)} (largest {sizes})")
+
+    if log.final_edge is not None:
+        i, j = log.final_edge
+        print(f"Final merge at connection {log.edges_used}: {coords[i][0] * coords[j][0]}")
+
+def all_pair_edges(coords):
+    '''Builds and sorts every pair up front (the original approach).'''
     n = len(coords)
-    
-    # 1. Generate all unique pairs and their distances
-    # We store (distance, index_a, index_b)
     edges = []
     for i in range(n):
         for j in range(i + 1, n):
             c1, c2 = coords[i], coords[j]
             dist = ((c1[0]-c2[0])**2 + (c1[1]-c2[1])**2 + (c1[2]-c2[2])**2)
             edges.append((dist, i, j))
-
-    # 2. Sort by distance (shortest first)
     edges.sort()
+    return edges
 
-    # 3. Union-Find setup
-    parent = list(range(n))
-    size = [1] * n
-    num_components = n
-
-    def find(i):
-        if parent[i] == i:
-            return i
-        parent[i] = find(parent[i]) # Path compression
-        return parent[i]
-
-    def union(i, j):
-        nonlocal num_components
-        root_i = find(i)
-        root_j = find(j)
-        if root_i != root_j:
-            # Union by size
-            if size[root_i] < size[root_j]:
-                root_i, root_j = root_j, root_i
-            parent[root_j] = root_i
-            size[root_i] += size[root_j]
-            num_components -= 1
-            return True # A merge occurred
-        return False # Already connected
-
-    # 4. Process edges
-    part1_ans = None
-    part2_ans = None
+def get_coords():
+    '''Parses the input into (x, y, z) tuples, or None if it cannot be read.'''
+    lines = get_lines_from_file()
+    if lines is None:
+        return None
 
-    for idx, (dist, i, j) in enumerate(edges):
-        # We perform the union operation
-        # Note: redundant connections (already in same circuit) 
-        # still count towards the '1000' limit in Part 1.
-        merge_happened = union(i, j)
-
-        # PART 1: Milestone at the 1000th connection (index 999)
-        if idx == 999:
-            # Calculate 3 largest circuit sizes
-            # Roots are elements where parent[i] == i
-            all_sizes = sorted([size[k] for k in range(n) if parent[k] == k], reverse=True)
-            part1_ans = all_sizes[0] * all_sizes[1] * all_sizes[2]
-
-        # PART 2: Milestone when the very last merge happens
-        if merge_happened and num_components == 1:
-            part2_ans = coords[i][0] * coords[j][0]
-            break
+    coords = []
+    for line in lines:
+        coords.append(tuple(map(int, line.split(','))))
+    return coords
+
+def solve():
+    coords = get_coords()
+    if coords is None:
+        return
+
+    # 1 & 2. Generate pairs (distance, index_a, index_b), shortest first.
+    # They are produced lazily, so only the pairs needed before the final
+    # merge are ever computed.
+    edges = lazy_edges(coords)
+
+    part1_ans, part2_ans, _ = connect_circuits(coords, edges)
 
     print(f"Part 1 Answer: {part1_ans}")
     print(f"Part 2 Answer: {part2_ans}")
 
+def benchmark(n=2000, seed=2025):
+    '''
+    Compares the lazy heap-merged edge stream against building and sorting every
+    pair, reporting how many edges each run actually consumed.
+    '''
+    rng = random.Random(seed)
+    coords = [tuple(rng.randint(0, 100000) for _ in range(3)) for _ in range(n)]
+    total_pairs = n * (n - 1) // 2
+    print(f"{n} points, {total_pairs} pairs")
+
+    start = time.perf_counter()
+    full = connect_circuits(coords, all_pair_edges(coords))
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    lazy = connect_circuits(coords, lazy_edges(coords))
+    lazy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rounds = connect_circuits(coords, spatial_edges(coords))
+    rounds_time = time.perf_counter() - start
+
+    results = [full[:2], lazy[:2], rounds[:2]]
+    print(f"Full sort: {full_time:.3f}s, {total_pairs} edges built")
+    print(f"k-NN rounds: {rounds_time:.3f}s, {rounds[2]} edges consumed")
+
+    if HAS_NUMPY:
+        start = time.perf_counter()
+        blocked = connect_circuits(coords, numpy_edges(coords))
+        blocked_time = time.perf_counter() - start
+        results.append(blocked[:2])
+        print(f"NumPy blocked: {blocked_time:.3f}s, {blocked[2]} edges consumed")
+    else:
+        print("NumPy is not installed; skipping the blocked NumPy path.")
+
+    print(f"Lazy heap: {lazy_time:.3f}s, {lazy[2]} edges consumed "
+          f"({100 * lazy[2] / total_pairs:.2f}% of all pairs)")
+
+    # Process pool scaling, up to 16 workers or the number of cores
+    max_workers = min(16, os.cpu_count() or 1)
+    worker_counts = [w for w in (1, 2, 4, 8, 16) if w <= max_workers]
+    for workers in worker_counts:
+        start = time.perf_counter()
+        parallel = connect_circuits(coords, parallel_edges(coords, workers=workers))
+        parallel_time = time.perf_counter() - start
+        results.append(parallel[:2])
+        print(f"Process pool ({workers} workers): {parallel_time:.3f}s, "
+              f"{total_pairs / parallel_time:,.0f} pairs/s")
+
+    status = "OK" if all(r == results[0] for r in results) else f"MISMATCH {results}"
+    print(f"Part 1 {results[0][0]}, Part 2 {results[0][1]} [{status}]")
+
 if __name__ == "__main__":
-    solve()
+    if "--bench" in sys.argv:
+        benchmark()
+    elif "--milestones" in sys.argv:
+        coords = get_coords()
+        if coords is not None:
+            milestone_report(coords)
+    else:
+        solve()
@@ -1,11 +1,36 @@
 import os
+import sys
+import math
+import time
+import bisect
+import random
 import itertools
-from shapely.geometry import Polygon, box
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional: without it the anchor rows are sorted in pure Python
+    np = None
+
+try:
+    import shapely
+    from shapely.geometry import Polygon, box
+    from shapely.prepared import prep
+except ImportError:
+    # Shapely is only needed for polygons that are not rectilinear
+    shapely = Polygon = box = prep = None
 
 # Configuration
 INPUT_FILE_NAME = 'input.txt'
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 FILE_PATH = os.path.join(SCRIPT_DIR, INPUT_FILE_NAME)
+HAS_NUMPY = np is not None
+# Shapely 2 has vectorized predicates that take arrays of geometries
+HAS_SHAPELY_ARRAYS = shapely is not None and hasattr(shapely, 'prepare')
+CHUNK_SIZE = 10**5
 
 def get_points():
     """Reads the input file and returns a list of (x, y) tuples."""
@@ -21,47 +46,734 @@ def get_points():
         print(f"Error reading file: {e}")
         return []
 
-def solve():
-    points = get_points()
-    if not points:
-        return
+class RectilinearPolygon:
+    """
+    Containment oracle for a polygon whose edges are all horizontal or vertical.
+
+    The vertex coordinates are compressed to indices, which cuts the plane into
+    cells that are each entirely inside or entirely outside the polygon. The
+    inside cells are rasterized with a scanline parity pass, and 2D prefix sums
+    over them answer "does the polygon cover this rectangle?" in O(1).
+    """
+
+    def __init__(self, points, use_numpy=HAS_NUMPY):
+        self.xs = sorted({x for x, _ in points})
+        self.ys = sorted({y for _, y in points})
+        self.x_index = x_index = {x: i for i, x in enumerate(self.xs)}
+        self.y_index = y_index = {y: i for i, y in enumerate(self.ys)}
+        cols, rows = len(self.xs) - 1, len(self.ys) - 1
+
+        # Each vertical edge flips the parity of its cell rows from its column onwards
+        edges = []
+        for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1]):
+            if x1 == x2:
+                a = x_index[x1]
+                if a == cols:
+                    continue  # Rightmost edge: no cells to its right
+                edges.append((a, y_index[min(y1, y2)], y_index[max(y1, y2)]))
+            elif y1 != y2:
+                raise ValueError(f"Edge ({x1}, {y1}) -> ({x2}, {y2}) is not axis-aligned")
+
+        # Arrays for covers_many(), only set up when NumPy is used
+        self._xs_array = self._ys_array = None
+        self.batch_available = HAS_NUMPY
+        if use_numpy:
+            self._build_numpy(edges, rows, cols)
+        else:
+            self._build_lists(edges, rows, cols)
+
+    def _build_lists(self, edges, rows, cols):
+        # toggles[b][a] flips the parity of cell row b from column a onwards
+        toggles = [[0] * max(cols, 0) for _ in range(max(rows, 0))]
+        for a, b1, b2 in edges:
+            for b in range(b1, b2):
+                toggles[b][a] ^= 1
+
+        # A cell is inside if an odd number of vertical edges lie to its left
+        inside = []
+        for row_toggles in toggles:
+            parity = 0
+            row = []
+            for toggle in row_toggles:
+                parity ^= toggle
+                row.append(parity)
+            inside.append(row)
+
+        # cell_sums[b][a] = number of inside cells in columns < a and rows < b
+        self.cell_sums = [[0] * (cols + 1) for _ in range(rows + 1)]
+        for b in range(rows):
+            running = 0
+            above, current = self.cell_sums[b], self.cell_sums[b + 1]
+            for a in range(cols):
+                running += inside[b][a]
+                current[a + 1] = above[a + 1] + running
+
+    def _build_numpy(self, edges, rows, cols):
+        # Same rasterization as _build_lists, one byte per cell
+        rows, cols = max(rows, 0), max(cols, 0)
+        inside = np.zeros((rows, cols), dtype=np.uint8)
+        for a, b1, b2 in edges:
+            inside[b1:b2, a] ^= 1
+        np.bitwise_xor.accumulate(inside, axis=1, out=inside)
+
+        # A cell count never exceeds rows * cols, so int32 usually suffices
+        dtype = np.int32 if rows * cols < 2 ** 31 else np.int64
+        self.cell_sums = np.zeros((rows + 1, cols + 1), dtype=dtype)
+        np.cumsum(inside, axis=0, dtype=dtype, out=self.cell_sums[1:, 1:])
+        np.cumsum(self.cell_sums[1:, 1:], axis=1, out=self.cell_sums[1:, 1:])
+
+        self._xs_array = np.array(self.xs, dtype=np.int64)
+        self._ys_array = np.array(self.ys, dtype=np.int64)
+
+    @classmethod
+    def from_prefix_sums(cls, xs, ys, cell_sums):
+        """
+        Rebuilds an oracle around existing prefix sums, such as a NumPy view of a
+        shared memory block, without rasterizing the polygon again.
+        """
+        oracle = cls.__new__(cls)
+        oracle.xs, oracle.ys = xs, ys
+        oracle.x_index = {x: i for i, x in enumerate(xs)}
+        oracle.y_index = {y: i for i, y in enumerate(ys)}
+        oracle.cell_sums = cell_sums
+        oracle._xs_array = np.array(xs, dtype=np.int64)
+        oracle._ys_array = np.array(ys, dtype=np.int64)
+        oracle.batch_available = True
+        return oracle
+
+    def covers(self, x1, y1, x2, y2):
+        """
+        Checks if every point of the rectangle with corners (x1, y1) and (x2, y2)
+        is inside or on the boundary of the polygon. The corner coordinates must be
+        vertex coordinates of the polygon.
+
+        Like Shapely's box(), a rectangle with zero width or height collapses to a
+        segment touching the boundary at its corners, which is never reported as
+        covered.
+        """
+        a1, a2 = sorted((self.x_index[x1], self.x_index[x2]))
+        b1, b2 = sorted((self.y_index[y1], self.y_index[y2]))
+
+        if a1 == a2 or b1 == b2:
+            return False
+
+        sums = self.cell_sums
+        covered = sums[b2][a2] - sums[b1][a2] - sums[b2][a1] + sums[b1][a1]
+        return bool(covered == (a2 - a1) * (b2 - b1))
+
+    def covers_many(self, x1, y1, x2, y2):
+        """
+        Vectorized covers() over NumPy arrays of corner coordinates. Returns a
+        boolean array with one entry per rectangle.
+        """
+        if self._xs_array is None:
+            # Built without NumPy: convert the prefix sums once, in place of the lists
+            self.cell_sums = np.array(self.cell_sums, dtype=np.int64)
+            self._xs_array = np.array(self.xs, dtype=np.int64)
+            self._ys_array = np.array(self.ys, dtype=np.int64)
+
+        a1 = np.searchsorted(self._xs_array, x1)
+        a2 = np.searchsorted(self._xs_array, x2)
+        b1 = np.searchsorted(self._ys_array, y1)
+        b2 = np.searchsorted(self._ys_array, y2)
+        a1, a2 = np.minimum(a1, a2), np.maximum(a1, a2)
+        b1, b2 = np.minimum(b1, b2), np.maximum(b1, b2)
+
+        sums = self.cell_sums
+        covered = sums[b2, a2] - sums[b1, a2] - sums[b2, a1] + sums[b1, a1]
+        return (a1 != a2) & (b1 != b2) & (covered == (a2 - a1) * (b2 - b1))
+
+    def _run(self, a, b, da, db):
+        """
+        Number of consecutive inside cells from cell (a, b) stepping by (da, db),
+        a unit step along one axis. Found by binary search on the prefix sums.
+        """
+        cols, rows = len(self.xs) - 1, len(self.ys) - 1
+        if not (0 <= a < cols and 0 <= b < rows):
+            return 0
+        if da:
+            limit = cols - a if da > 0 else a + 1
+        else:
+            limit = rows - b if db > 0 else b + 1
+        sums = self.cell_sums
+
+        def all_inside(length):
+            # Cell span [a1, a2) x [b1, b2) covering `length` cells from (a, b)
+            a1, a2, b1, b2 = a, a + 1, b, b + 1
+            if da > 0:
+                a2 = a + length
+            elif da < 0:
+                a1 = a + 1 - length
+            elif db > 0:
+                b2 = b + length
+            else:
+                b1 = b + 1 - length
+            return sums[b2][a2] - sums[b1][a2] - sums[b2][a1] + sums[b1][a1] == length
 
+        low, high = 0, limit
+        while low < high:
+            mid = (low + high + 1) // 2
+            if all_inside(mid):
+                low = mid
+            else:
+                high = mid - 1
+        return low
+
+    def corner_bounds(self, points):
+        """
+        Upper bound on the area of any covered rectangle with a corner at each
+        point. A rectangle reaching right and up from its corner contains the
+        inside cells along its bottom row and its left column, so the runs of
+        inside cells from the corner cap its width and height. The bound is the
+        largest such product over the four quadrants.
+        """
+        xs, ys = self.xs, self.ys
+        bounds = []
+        for x, y in points:
+            a, b = self.x_index[x], self.y_index[y]
+            best = 0
+            for da in (1, -1):
+                for db in (1, -1):
+                    # The quadrant's corner cell lies left of / below the vertex when stepping that way
+                    ca = a if da > 0 else a - 1
+                    cb = b if db > 0 else b - 1
+                    width = self._run(ca, cb, da, 0)
+                    height = self._run(ca, cb, 0, db)
+                    if width and height:
+                        far_x = xs[a + width] if da > 0 else xs[a - width]
+                        far_y = ys[b + height] if db > 0 else ys[b - height]
+                        best = max(best, (abs(far_x - x) + 1) * (abs(far_y - y) + 1))
+            bounds.append(best)
+        return bounds
+
+class ShapelyContainment:
+    """
+    Containment oracle backed by Shapely, for polygons of any shape. Single
+    rectangles are checked against a prepared polygon; with Shapely 2, covers_many
+    checks whole arrays of boxes in one call.
+    """
+
+    def __init__(self, points):
+        self.poly = Polygon(points)
+        self.prepared = prep(self.poly)
+        self.batch_available = HAS_SHAPELY_ARRAYS
+        if HAS_SHAPELY_ARRAYS:
+            # Prepared in place, so every vectorized covers() call reuses its spatial index
+            shapely.prepare(self.poly)
+
+    def covers(self, x1, y1, x2, y2):
+        # .covers() checks if every point of the rectangle is inside or on the boundary of the polygon
+        return self.prepared.covers(box(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)))
+
+    def corner_bounds(self, points):
+        # No cheap polygon-aware bound here, so fall back to the bounding box
+        return anchor_bounds(points)
+
+    def covers_many(self, x1, y1, x2, y2):
+        boxes = shapely.box(np.minimum(x1, x2), np.minimum(y1, y2), np.maximum(x1, x2), np.maximum(y1, y2))
+        return shapely.covers(self.poly, boxes)
+
+def containment_oracle(points, use_shapely=False):
+    """
+    Builds the containment oracle for the polygon: the prefix-sum oracle for
+    rectilinear polygons, Shapely for anything else or when use_shapely=True.
+    Either way it offers covers(x1, y1, x2, y2), and covers_many over NumPy arrays
+    of corners when batch_available is set.
+    """
+    if not use_shapely:
+        try:
+            return RectilinearPolygon(points)
+        except ValueError:
+            pass
+
+    if Polygon is None:
+        raise ValueError(
+            "The polygon is not rectilinear; install Shapely to handle it"
+        )
+    return ShapelyContainment(points)
+
+# --- Rectangle Search ---
+
+def rectangle_area(p1, p2):
+    """Area in tiles of the rectangle with opposite corners p1 and p2."""
+    return (abs(p1[0] - p2[0]) + 1) * (abs(p1[1] - p2[1]) + 1)
+
+def scan_pairs(points, covers):
+    """
+    Reference search: walks every pair in input order and only checks
+    containment when the area would beat the best covered rectangle so far.
+    Returns (largest area, largest covered area).
+    """
     max_area_p1 = 0
     max_area_p2 = 0
-    
-    # Part 2 requires a Polygon object representing the red/green boundary
-    # The list of points is already ordered as a loop per the puzzle description
-    poly = Polygon(points)
-
-    # Iterate through all unique pairs of red tiles
     for p1, p2 in itertools.combinations(points, 2):
-        x1, y1 = p1
-        x2, y2 = p2
-        
-        # Calculate dimensions
-        width = abs(x1 - x2) + 1
-        height = abs(y1 - y2) + 1
-        current_area = width * height
-
-        # Part 1: Simply find the largest possible area
+        current_area = rectangle_area(p1, p2)
         if current_area > max_area_p1:
             max_area_p1 = current_area
+        if current_area > max_area_p2 and covers(*p1, *p2):
+            max_area_p2 = current_area
+    return max_area_p1, max_area_p2
+
+def anchor_bounds(points):
+    """
+    Polygon-agnostic upper bound on the area of any rectangle anchored at each
+    point: its partner lies inside the bounding box of all points, so the
+    rectangle can be no wider or taller than the distance to the far side of it.
+    """
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    min_x, max_x, min_y, max_y = min(xs), max(xs), min(ys), max(ys)
+    return [
+        (max(x - min_x, max_x - x) + 1) * (max(y - min_y, max_y - y) + 1)
+        for x, y in points
+    ]
+
+def largest_area(points, use_numpy=HAS_NUMPY):
+    """Part 1: the largest rectangle over all pairs, ignoring the polygon."""
+    if use_numpy:
+        coords = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+        best = 0
+        for i in range(len(coords) - 1):
+            rest = coords[i + 1:]
+            areas = (np.abs(rest[:, 0] - coords[i, 0]) + 1) * (np.abs(rest[:, 1] - coords[i, 1]) + 1)
+            best = max(best, int(areas.max()))
+        return best
+    return max((rectangle_area(p1, p2) for p1, p2 in itertools.combinations(points, 2)), default=0)
+
+def anchor_row(points, i, bounds, use_numpy=HAS_NUMPY):
+    """
+    Pair areas between points[i] and every later point j, sorted by descending
+    area, keeping only the pairs within both corner bounds[i] and bounds[j].
+    Returns (negated areas, partner indices) so the row can be cut with an
+    ascending bisect. With NumPy, points is an (n, 2) int64 array and bounds an
+    int64 array.
+    """
+    if use_numpy:
+        rest = points[i + 1:]
+        areas = (np.abs(rest[:, 0] - points[i, 0]) + 1) * (np.abs(rest[:, 1] - points[i, 1]) + 1)
+        partners = np.flatnonzero(areas <= np.minimum(bounds[i + 1:], bounds[i]))
+        areas = areas[partners]
+        order = np.argsort(-areas, kind='stable')
+        return -areas[order], partners[order] + (i + 1)
+
+    anchor, limit = points[i], bounds[i]
+    row = []
+    for j in range(i + 1, len(points)):
+        area = rectangle_area(anchor, points[j])
+        if area <= limit and area <= bounds[j]:
+            row.append((-area, j))
+    row.sort()
+    return [neg for neg, _ in row], [j for _, j in row]
+
+def descending_batches(points, bounds, shrink=0.9, use_numpy=HAS_NUMPY):
+    """
+    Yields every pair i < j whose area is within both corner bounds, as batches
+    of (areas, i's, j's). Each batch is sorted by descending area and lies
+    entirely below the one before it.
+
+    Batch k holds the pairs with area >= a threshold T that drops by the factor
+    `shrink` each round. A pair of area >= T can only come from an anchor whose
+    bound is >= T, so anchors are expanded (their pair areas computed and sorted)
+    only once T falls below their bound; anchors that never get there are skipped
+    wholesale when the consumer stops early.
+    """
+    pending = sorted(range(len(points)), key=lambda i: -bounds[i])
+    if use_numpy:
+        coords = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+        row_bounds = np.asarray(bounds, dtype=np.int64)
+    else:
+        coords, row_bounds = points, bounds
+    next_anchor = 0
+    rows = []  # [anchor, negated areas, partners, cut position]
+    threshold = bounds[pending[0]] if pending else 0
+
+    while next_anchor < len(pending) or rows:
+        threshold = int(threshold * shrink)
+        while next_anchor < len(pending) and bounds[pending[next_anchor]] >= threshold:
+            i = pending[next_anchor]
+            next_anchor += 1
+            negs, partners = anchor_row(coords, i, row_bounds, use_numpy)
+            if len(negs):
+                rows.append([i, negs, partners, 0])
+
+        # Cut every expanded row at the threshold
+        negs_cut, firsts, seconds = [], [], []
+        for row in rows:
+            i, negs, partners, pos = row
+            if use_numpy:
+                cut = int(negs.searchsorted(-threshold, side='right'))
+                if cut > pos:
+                    negs_cut.append(negs[pos:cut])
+                    firsts.append((i, cut - pos))
+                    seconds.append(partners[pos:cut])
+            else:
+                cut = bisect.bisect_right(negs, -threshold)
+                negs_cut.extend(zip(negs[pos:cut], [i] * (cut - pos), partners[pos:cut]))
+            row[3] = cut
+        rows = [row for row in rows if row[3] < len(row[1])]
+
+        if not negs_cut:
+            continue
+        if use_numpy:
+            negs_cut = np.concatenate(negs_cut)
+            anchors, counts = zip(*firsts)
+            firsts = np.repeat(np.array(anchors, dtype=np.int64), counts)
+            seconds = np.concatenate(seconds)
+            order = np.argsort(negs_cut, kind='stable')
+            yield -negs_cut[order], firsts[order], seconds[order]
+        else:
+            negs_cut.sort()
+            yield [-neg for neg, _, _ in negs_cut], [i for _, i, _ in negs_cut], [j for _, _, j in negs_cut]
+
+def search_descending(points, covers, covers_many=None, bounds=None, chunk_size=CHUNK_SIZE, use_numpy=HAS_NUMPY):
+    """
+    Checks candidate rectangles from largest to smallest and stops at the first one
+    the polygon covers. bounds holds an upper bound on the covered area at each
+    point (see corner_bounds), defaulting to the bounding-box anchor_bounds. If
+    covers_many is given (see containment_oracle) the candidates are checked
+    chunk_size at a time with it.
+    Returns (largest area, largest covered area, containment checks).
+    """
+    if covers_many is not None and not use_numpy:
+        raise ValueError("covers_many needs the NumPy search")
+
+    if covers_many is not None:
+        coords = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+    if bounds is None:
+        bounds = anchor_bounds(points)
+
+    max_area_p1 = largest_area(points, use_numpy)
+    checks = 0
+    for areas, firsts, seconds in descending_batches(points, bounds, use_numpy=use_numpy):
+        if covers_many is None:
+            for area, i, j in zip(areas, firsts, seconds):
+                checks += 1
+                if covers(*points[i], *points[j]):
+                    return max_area_p1, int(area), checks
+            continue
 
-        # Part 2: Check if the rectangle is entirely within the red/green region
-        # Optimization: Only do the Shapely check if the area is potentially the new max
-        if current_area > max_area_p2:
-            xmin, xmax = (x1, x2) if x1 < x2 else (x2, x1)
-            ymin, ymax = (y1, y2) if y1 < y2 else (y2, y1)
-            
-            # Create a geometric box for the candidate rectangle
-            rect = box(xmin, ymin, xmax, ymax)
-            
-            # .covers() checks if every point of the rectangle is inside or on the boundary of the polygon
-            if poly.covers(rect):
-                max_area_p2 = current_area
+        for start in range(0, len(areas), chunk_size):
+            stop = start + chunk_size
+            p, q = coords[firsts[start:stop]], coords[seconds[start:stop]]
+            hits = np.flatnonzero(covers_many(p[:, 0], p[:, 1], q[:, 0], q[:, 1]))
+            if len(hits):
+                checks += int(hits[0]) + 1
+                return max_area_p1, int(areas[start + hits[0]]), checks
+            checks += len(p)
+
+    return max_area_p1, 0, checks
+
+# --- Parallel Search ---
+
+# Polygon, corner bounds and shared best area handed to each worker process once, by the pool initializer
+_worker_points = None
+_worker_coords = None
+_worker_bounds = None
+_worker_covers = None
+_worker_covers_many = None
+_worker_best = None
+_worker_shm = None
+
+def _init_search_worker(points, oracle, shared_grid, bounds, best):
+    global _worker_points, _worker_coords, _worker_bounds, _worker_covers, _worker_covers_many
+    global _worker_best, _worker_shm
+    _worker_points = points
+    _worker_bounds = bounds
+    _worker_best = best
+    if shared_grid is not None:
+        # Attach to the parent's prefix sums instead of holding a copy per worker
+        xs, ys, shm_name, shape, dtype = shared_grid
+        _worker_shm = shared_memory.SharedMemory(name=shm_name)
+        sums = np.ndarray(shape, dtype=dtype, buffer=_worker_shm.buf)
+        oracle = RectilinearPolygon.from_prefix_sums(xs, ys, sums)
+    if oracle is not None:
+        _worker_covers = oracle.covers
+        _worker_covers_many = oracle.covers_many if HAS_NUMPY else None
+    else:
+        # A prepared Shapely polygon cannot be shipped to a worker, so it is rebuilt here
+        shapely_oracle = ShapelyContainment(points)
+        _worker_covers = shapely_oracle.covers
+        _worker_covers_many = shapely_oracle.covers_many if shapely_oracle.batch_available else None
+    if _worker_covers_many is not None:
+        _worker_coords = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+        _worker_bounds = np.asarray(bounds, dtype=np.int64)
+
+def _search_anchors_worker(anchors, chunk_size=1024):
+    """
+    Searches the pairs (i, j > i) for every anchor i in the shard. Anchors whose
+    corner bound cannot beat the best covered area found by any worker so far,
+    published through the shared Value, are skipped; other rows are walked in
+    descending area order only while they can still beat it. With NumPy the rows
+    come from anchor_row and are checked chunk_size pairs at a time with
+    covers_many, cut again at the shared best before every chunk.
+    Returns the number of containment checks made for the shard.
+    """
+    points, bounds, covers, best = _worker_points, _worker_bounds, _worker_covers, _worker_best
+    covers_many, coords = _worker_covers_many, _worker_coords
+    checks = 0
+
+    if covers_many is None:
+        for i in anchors:
+            if bounds[i] <= best.value:
+                continue
+            negs, partners = anchor_row(points, i, bounds, use_numpy=False)
+            for neg, j in zip(negs, partners):
+                if -neg <= best.value:
+                    break
+                checks += 1
+                if covers(*points[i], *points[j]):
+                    with best.get_lock():
+                        if -neg > best.value:
+                            best.value = -neg
+                    break
+        return checks
+
+    for i in anchors:
+        if bounds[i] <= best.value:
+            continue
+        negs, partners = anchor_row(coords, i, bounds, use_numpy=True)
+
+        start = 0
+        while True:
+            # Only pairs strictly larger than the shared best are worth checking
+            stop = min(int(negs.searchsorted(-best.value, side='left')), start + chunk_size)
+            if start >= stop:
+                break
+            q = coords[partners[start:stop]]
+            hits = np.flatnonzero(covers_many(coords[i, 0], coords[i, 1], q[:, 0], q[:, 1]))
+            if len(hits):
+                checks += int(hits[0]) + 1
+                area = int(-negs[start + hits[0]])
+                with best.get_lock():
+                    if area > best.value:
+                        best.value = area
+                break
+            checks += stop - start
+            start = stop
+    return checks
+
+def parallel_search(points, workers=None, chunks_per_worker=8, use_shapely=False):
+    """
+    Shards the pair space by first index over worker processes. Anchors are handed
+    out largest corner bound first, so the shared best area rises early and later
+    shards prune most of their rows. With NumPy the workers attach to one copy of
+    the prefix sums in shared memory and check rows in vectorized chunks; without
+    it each gets its own copy of the list-based oracle. Shapely polygons are
+    rebuilt and prepared in every worker.
+    Returns (largest area, largest covered area, containment checks).
+    """
+    if not points:
+        return 0, 0, 0
+
+    oracle = None
+    if not use_shapely:
+        try:
+            oracle = RectilinearPolygon(points)
+        except ValueError:
+            pass
+    if oracle is None and Polygon is None:
+        raise ValueError("The polygon is not rectilinear; install Shapely to handle it")
+
+    bounds = oracle.corner_bounds(points) if oracle is not None else anchor_bounds(points)
+    order = sorted(range(len(points)), key=lambda i: -bounds[i])
+    workers = workers or os.cpu_count() or 1
+    chunk = max(1, -(-len(order) // (workers * chunks_per_worker)))
+    shards = [order[start:start + chunk] for start in range(0, len(order), chunk)]
+
+    # With NumPy the prefix sums go into shared memory, attached to by every worker
+    shm = shared_grid = None
+    if oracle is not None and HAS_NUMPY:
+        sums = oracle.cell_sums
+        shm = shared_memory.SharedMemory(create=True, size=max(1, sums.nbytes))
+        np.ndarray(sums.shape, dtype=sums.dtype, buffer=shm.buf)[...] = sums
+        shared_grid = (oracle.xs, oracle.ys, shm.name, sums.shape, sums.dtype.str)
+        oracle = None
+
+    best = multiprocessing.Value('q', 0)
+    initargs = (points, oracle, shared_grid, bounds, best)
+    try:
+        with ProcessPoolExecutor(workers, initializer=_init_search_worker, initargs=initargs) as pool:
+            checks = sum(pool.map(_search_anchors_worker, shards))
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    return largest_area(points), best.value, checks
+
+def random_skyline(num_columns, rng):
+    """
+    Builds a random rectilinear polygon with 2 * num_columns + 2 vertices: a row
+    of columns with random heights standing on the x axis.
+    """
+    xs = sorted(rng.sample(range(1, 100 * num_columns), num_columns + 1))
+    heights = [rng.randrange(1, 100 * num_columns) for _ in range(num_columns)]
+    points = [(xs[0], 0)]
+    for k, height in enumerate(heights):
+        points.append((xs[k], height))
+        points.append((xs[k + 1], height))
+    points.append((xs[-1], 0))
+    return points
+
+def benchmark(num_columns=1000, seed=1):
+    """
+    Times the input-order scan against the descending-area search, including the
+    corner bounds the search prunes with.
+    """
+    cases = [("input", get_points())]
+    cases.append((f"skyline ({2 * num_columns + 2} vertices)", random_skyline(num_columns, random.Random(seed))))
+
+    for name, points in cases:
+        if not points:
+            continue
+        oracle = containment_oracle(points)
+        covers = oracle.covers
+        print(f"{name}: {len(points)} points")
+
+        start = time.perf_counter()
+        expected = scan_pairs(points, covers)
+        print(f"  input-order scan:          {time.perf_counter() - start:.3f}s")
+
+        variants = [("pure Python", False, None)]
+        if HAS_NUMPY:
+            variants.append(("NumPy", True, None))
+            if oracle.batch_available:
+                variants.append(("NumPy batched", True, oracle.covers_many))
+
+        for label, use_numpy, covers_many in variants:
+            start = time.perf_counter()
+            bounds = oracle.corner_bounds(points)
+            *result, checks = search_descending(points, covers, covers_many, bounds, use_numpy=use_numpy)
+            elapsed = time.perf_counter() - start
+            status = "[OK]" if tuple(result) == expected else "MISMATCH"
+            print(f"  descending ({label}):{' ' * (14 - len(label))}{elapsed:.3f}s, {checks} checks {status}")
+
+def random_star(num_vertices, rng, radius=10**6):
+    """
+    Builds a random star-shaped polygon: vertices at increasing angles around the
+    origin with random distances from it. Its edges are almost never axis-aligned.
+    """
+    angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(num_vertices))
+    points = []
+    for angle in angles:
+        r = rng.uniform(radius / 2, radius)
+        points.append((round(r * math.cos(angle)), round(r * math.sin(angle))))
+    return points
+
+def benchmark_shapely(num_vertices=10**4, num_pairs=CHUNK_SIZE, loop_pairs=2000, seed=1):
+    """
+    Times Shapely containment checks: the original one-call-per-pair loop on a
+    plain polygon against the prepared polygon, per pair and vectorized.
+    """
+    if Polygon is None or not HAS_SHAPELY_ARRAYS:
+        print("Shapely 2 is not installed, skipping the Shapely benchmark")
+        return
+
+    points = get_points()
+    if points:
+        poly = Polygon(points)
+
+        def plain_covers(x1, y1, x2, y2):
+            return poly.covers(box(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)))
+
+        print(f"input with Shapely: {len(points)} points")
+        start = time.perf_counter()
+        expected = scan_pairs(points, plain_covers)
+        print(f"  input-order scan, plain polygon:  {time.perf_counter() - start:.3f}s")
+
+        oracle = containment_oracle(points, use_shapely=True)
+        covers, covers_many = oracle.covers, oracle.covers_many
+        start = time.perf_counter()
+        *result, checks = search_descending(points, covers, covers_many, oracle.corner_bounds(points))
+        elapsed = time.perf_counter() - start
+        status = "[OK]" if tuple(result) == expected else "MISMATCH"
+        print(f"  descending, prepared + batched:   {elapsed:.3f}s, {checks} checks {status}")
+
+    # A full search over 10^4 vertices is ~5 * 10^7 pairs, so compare check rates
+    # on a random sample of candidate rectangles instead
+    rng = random.Random(seed)
+    polygons = [
+        (f"star ({num_vertices} vertices)", random_star(num_vertices, rng)),
+        (f"skyline ({num_vertices} vertices)", random_skyline(num_vertices // 2 - 1, rng)),
+    ]
+    for name, points in polygons:
+        print(f"{name}: {num_pairs} sampled rectangles")
+        pairs = [rng.sample(range(len(points)), 2) for _ in range(num_pairs)]
+        coords = np.asarray(points, dtype=np.int64)
+        p, q = coords[[i for i, _ in pairs]], coords[[j for _, j in pairs]]
+
+        poly = Polygon(points)
+        oracle = containment_oracle(points, use_shapely=True)
+        covers, covers_many = oracle.covers, oracle.covers_many
+        sample = [(*points[i], *points[j]) for i, j in pairs[:loop_pairs]]
+
+        start = time.perf_counter()
+        plain = [poly.covers(box(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))) for x1, y1, x2, y2 in sample]
+        plain_rate = len(sample) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        prepared = [covers(*corners) for corners in sample]
+        prepared_rate = len(sample) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        batched = covers_many(p[:, 0], p[:, 1], q[:, 0], q[:, 1])
+        batched_rate = num_pairs / (time.perf_counter() - start)
+
+        status = "[OK]" if plain == prepared == batched[:loop_pairs].tolist() else "MISMATCH"
+        print(f"  plain polygon loop:    {plain_rate:12,.0f} checks/s")
+        print(f"  prepared polygon loop: {prepared_rate:12,.0f} checks/s")
+        print(f"  prepared + vectorized: {batched_rate:12,.0f} checks/s {status}")
+
+def benchmark_parallel(num_columns=4999, seed=1):
+    """Times the sharded multiprocessing search for growing worker counts."""
+    points = random_skyline(num_columns, random.Random(seed))
+    print(f"parallel skyline: {len(points)} points, {os.cpu_count()} CPUs")
+
+    start = time.perf_counter()
+    oracle = containment_oracle(points)
+    expected = search_descending(points, oracle.covers, oracle.covers_many, oracle.corner_bounds(points))[:2]
+    print(f"  sequential: {time.perf_counter() - start:.3f}s")
+
+    workers = 1
+    while True:
+        start = time.perf_counter()
+        *result, checks = parallel_search(points, workers)
+        elapsed = time.perf_counter() - start
+        status = "[OK]" if tuple(result) == expected else "MISMATCH"
+        print(f"  {workers:2} workers: {elapsed:.3f}s, {checks} checks {status}")
+        if workers >= (os.cpu_count() or 1):
+            break
+        workers = min(2 * workers, os.cpu_count())
+
+# --- Main Logic ---
+
+def solve(parallel=False):
+    points = get_points()
+    if not points:
+        return
+
+    # Part 2 requires a containment check against the red/green boundary
+    # The list of points is already ordered as a loop per the puzzle description
+    try:
+        if parallel:
+            max_area_p1, max_area_p2, _ = parallel_search(points)
+        else:
+            oracle = containment_oracle(points)
+            covers_many = oracle.covers_many if oracle.batch_available else None
+            bounds = oracle.corner_bounds(points)
+            # Candidates come largest first, so the first covered one is the answer
+            max_area_p1, max_area_p2, _ = search_descending(points, oracle.covers, covers_many, bounds)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
 
     print(f"Part 1 answer: {max_area_p1}")
     print(f"Part 2 answer: {max_area_p2}")
 
 if __name__ == "__main__":
-    solve()
\ No newline at end of file
+    if "--bench" in sys.argv:
+        benchmark()
+        benchmark_shapely()
+        benchmark_parallel()
+    else:
+        solve(parallel="--parallel" in sys.argv)
@@ -1,8 +1,10 @@
 import os
+import sys
 import math
+import time
+import random
 import itertools
 from collections import deque
-from concurrent.futures import ThreadPoolExecutor
 from fractions import Fraction
 
 # Configuration
@@ -99,6 +101,135 @@ def solve_part1(machine):
                 
     return 0
 
+# -----------------------------------------------------------------------------
+# Part 1: Linear Algebra over GF(2)
+# -----------------------------------------------------------------------------
+
+def reduce_gf2(target_state, buttons):
+    """
+    Solves buttons * x = target over GF(2), where column b of the system is the
+    bitmask of button b. Each light is a row stored as a bitmask over the buttons,
+    with the target bit in position len(buttons).
+
+    Returns (rhs, patterns) describing every solution, or None if the target is
+    unreachable. Free buttons are the columns without a pivot; pressing free
+    button f forces the pivot buttons of the rows in patterns[f] to toggle, and
+    bit i of rhs is the pivot button of row i when no free button is pressed.
+    A solution pressing the free buttons F therefore costs
+    len(F) + popcount(rhs ^ XOR of patterns[f] for f in F).
+    """
+    num_buttons = len(buttons)
+    num_lights = max([target_state.bit_length()] + [b.bit_length() for b in buttons])
+    rows = []
+    for light in range(num_lights):
+        row = (target_state >> light & 1) << num_buttons
+        for b, mask in enumerate(buttons):
+            row |= (mask >> light & 1) << b
+        rows.append(row)
+
+    # Reduced row echelon form: each pivot column is set in exactly one row
+    pivot_rows = []
+    pivot_cols = []
+    for col in range(num_buttons):
+        bit = 1 << col
+        pivot = next((r for r in rows if r & bit), None)
+        if pivot is None:
+            continue
+        rows.remove(pivot)
+        rows = [r ^ pivot if r & bit else r for r in rows]
+        pivot_rows = [r ^ pivot if r & bit else r for r in pivot_rows]
+        pivot_rows.append(pivot)
+        pivot_cols.append(col)
+
+    # Leftover rows have no buttons left; a set target bit means no solution
+    if any(rows):
+        return None
+
+    rhs = 0
+    for i, row in enumerate(pivot_rows):
+        rhs |= (row >> num_buttons & 1) << i
+
+    pivots = set(pivot_cols)
+    patterns = []
+    for f in range(num_buttons):
+        if f in pivots:
+            continue
+        pattern = 0
+        for i, row in enumerate(pivot_rows):
+            pattern |= (row >> f & 1) << i
+        patterns.append(pattern)
+
+    return rhs, patterns
+
+def subset_table(patterns):
+    """
+    Maps the XOR of every subset of patterns to the smallest subset size reaching
+    it. Subsets with equal XORs are merged as they are built, so the table never
+    outgrows the 2^rank patterns the pivot rows can form.
+    """
+    table = {0: 0}
+    for pattern in patterns:
+        for x, n in list(table.items()):
+            y = x ^ pattern
+            if n + 1 < table.get(y, math.inf):
+                table[y] = n + 1
+    return table
+
+def min_weight_direct(rhs, patterns):
+    """
+    Walks every combination of free buttons in Gray code order, so that each step
+    toggles a single free button.
+    """
+    best = rhs.bit_count()
+    current = rhs
+    chosen = 0
+    for g in range(1, 1 << len(patterns)):
+        f = (g & -g).bit_length() - 1
+        current ^= patterns[f]
+        chosen ^= 1 << f
+        weight = chosen.bit_count() + current.bit_count()
+        if weight < best:
+            best = weight
+    return best
+
+def min_weight_by_pattern(rhs, patterns):
+    """
+    Subset DP over pivot patterns: subset_table gives the fewest free presses for
+    every pivot pattern the free buttons can produce, and the pivot buttons still
+    pressed for pattern u are rhs ^ u. The table holds at most 2^rank entries,
+    however many free buttons there are, so the cost is about nullity * 2^rank.
+    """
+    table = subset_table(patterns)
+    return min(n + (rhs ^ u).bit_count() for u, n in table.items())
+
+def solve_part1_gf2(machine):
+    """
+    Minimum presses to reach the target: one solution of the GF(2) system plus
+    its null space, searched for the solution of smallest Hamming weight.
+    Returns 0 for unreachable targets, like solve_part1.
+
+    The search runs the subset DP over pivot patterns when the rank is well below
+    the nullity and Gray code enumeration otherwise, so its cost is roughly
+    min(nullity * 2^rank, 2^nullity). The worst case is rank close to nullity:
+    20 lights with 40 buttons takes 2^20 Gray code steps, about 160 ms.
+    """
+    target_state, buttons = machine
+    if target_state == 0:
+        return 0
+
+    reduced = reduce_gf2(target_state, buttons)
+    if reduced is None:
+        return 0
+
+    rhs, patterns = reduced
+    rank = len(buttons) - len(patterns)
+
+    # Pick the cheaper search: 2^nullity Gray code steps, or nullity passes over
+    # a table of up to 2^rank pivot patterns
+    if len(patterns) << rank < 1 << len(patterns):
+        return min_weight_by_pattern(rhs, patterns)
+    return min_weight_direct(rhs, patterns)
+
 # -----------------------------------------------------------------------------
 # Part 2: Linear Diophantine Equation Minimization
 # -----------------------------------------------------------------------------
@@ -414,8 +545,7 @@ def solve():
         return
 
     # Part 1 Execution
-    with ThreadPoolExecutor() as executor:
-        ans_p1 = sum(executor.map(solve_part1, p1_data))
+    ans_p1 = sum(map(solve_part1_gf2, p1_data))
 
     # Part 2 Execution
     # Note: Threading can be added here, but sequential is safer for debugging/limits
@@ -424,5 +554,49 @@ def solve():
     print(f"Part 1 answer: {ans_p1}")
     print(f"Part 2 answer: {ans_p2}")
 
+def random_machine(num_lights, num_buttons, rng, reachable=True):
+    """Builds a random Part 1 machine; reachable targets are XORs of some buttons."""
+    buttons = [rng.getrandbits(num_lights) or 1 for _ in range(num_buttons)]
+    if not reachable:
+        return rng.getrandbits(num_lights), buttons
+    target = 0
+    for mask in buttons:
+        if rng.random() < 0.5:
+            target ^= mask
+    return target, buttons
+
+def benchmark(seed=1):
+    """Checks the GF(2) solver against the BFS and times it on large machines."""
+    rng = random.Random(seed)
+    p1_data, _ = get_machine_data()
+
+    start = time.perf_counter()
+    expected = [solve_part1(machine) for machine in p1_data]
+    bfs_time = time.perf_counter() - start
+    start = time.perf_counter()
+    result = [solve_part1_gf2(machine) for machine in p1_data]
+    gf2_time = time.perf_counter() - start
+    status = "OK" if result == expected else "MISMATCH"
+    print(f"Input ({len(p1_data)} machines): BFS {bfs_time:.3f}s, GF(2) {gf2_time:.3f}s [{status}]")
+
+    # Small random machines, including unreachable targets and wide null spaces
+    machines = [
+        random_machine(rng.randint(1, 10), rng.randint(1, 24), rng, reachable=rng.random() < 0.8)
+        for _ in range(300)
+    ]
+    mismatches = sum(solve_part1(m) != solve_part1_gf2(m) for m in machines)
+    print(f"Random small machines: {len(machines)} checked [{'OK' if not mismatches else 'MISMATCH'}]")
+
+    for num_lights, num_buttons in [(32, 40), (40, 40), (12, 48), (26, 46), (30, 50)]:
+        machines = [random_machine(num_lights, num_buttons, rng) for _ in range(20)]
+        start = time.perf_counter()
+        for machine in machines:
+            solve_part1_gf2(machine)
+        elapsed = (time.perf_counter() - start) / len(machines)
+        print(f"{num_lights} lights, {num_buttons} buttons: {elapsed * 1000:.2f} ms per machine")
+
 if __name__ == "__main__":
-    solve()
\ No newline at end of file
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        solve()
\ No newline at end of file